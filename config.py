@@ -17,11 +17,19 @@ JOB_MAX_APPLICATIONS = 50
 JOB_MIN_APPLICATIONS = 1
 
 LLM_MODEL_TYPE = 'gemini'
+# Embeddings used to index job postings. 'fastembed' runs a small ONNX model locally;
+# set to None to use the embeddings that match LLM_MODEL_TYPE
+LLM_EMBEDDINGS_TYPE = 'fastembed'
 #LLM_MODEL_TYPE = 'ollama'
 LLM_MODEL = 'gemini-2.0-flash-thinking-exp-01-21'
 #LLM_MODEL = 'gemini-1.5-flash'
 #LLM_MODEL = 'gemma3:4b-it-fp16'
 #LLM_MODEL = 'qwen2.5:7b-instruct'
 #LLM_MODEL = 'llama3:8b'
+# Optional smaller model of the same type for job detail extraction; None uses LLM_MODEL
+LLM_MODEL_CHEAP = None
+# Client-side limits matching your API plan, so parallel calls wait instead of hitting rate limits; None disables a limit
+LLM_REQUESTS_PER_MINUTE = None
+LLM_TOKENS_PER_MINUTE = None
 # Only required for OLLAMA models
 LLM_API_URL = '127.0.0.1:11434'
\ No newline at end of file
@@ -1,8 +1,8 @@
 import base64
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import traceback
 from typing import List, Tuple, Dict
 import inquirer
 import yaml
@@ -11,7 +11,7 @@ import re
 from src.libs.resume_and_cover_builder import ResumeFacade, ResumeGenerator, StyleManager
 from src.resume_schemas.resume import Resume
 from src.logging import logger
-from src.utils.chrome_utils import init_browser
+from src.utils.chrome_utils import init_browser, init_pdf_browser
 from src.utils.constants import (
     PLAIN_TEXT_RESUME_YAML,
     SECRETS_YAML,
@@ -272,8 +272,9 @@ def create_cover_letter(parameters: dict, llm_api_key: str):
         
         # Initialize the Resume Generator
         resume_facade.set_driver(driver)
-        resume_facade.link_to_job(job_url)
-        result_base64, suggested_name = resume_facade.util_create_cover_letter()         
+        with resume_facade:
+            resume_facade.link_to_job(job_url)
+            result_base64, suggested_name = resume_facade.util_create_cover_letter()
 
         # Decodifica Base64 in dati binari
         try:
@@ -364,8 +365,9 @@ def create_resume_pdf_tailored(parameters: dict, llm_api_key: str):
             output_path=Path("data_folder/output"),
         )
         resume_facade.set_driver(driver)
-        resume_facade.link_to_job(job_url)
-        result_base64, suggested_name = resume_facade.util_create_resume_pdf_job_tailored()
+        with resume_facade:
+            resume_facade.link_to_job(job_url)
+            result_base64, suggested_name = resume_facade.util_create_resume_pdf_job_tailored()
 
         # Decodifica Base64 in dati binari
         try:
@@ -398,6 +400,92 @@ def create_resume_pdf_tailored(parameters: dict, llm_api_key: str):
         raise
 
 
+def create_resume_and_cover_letter_tailored(parameters: dict, llm_api_key: str):
+    """
+    Logic to create both a tailored CV and a cover letter for the same job description.
+    """
+    try:
+        logger.info("Generating a tailored CV and cover letter based on provided parameters.")
+
+        with open(parameters["uploads"]["plainTextResume"], "r", encoding="utf-8") as file:
+            plain_text_resume = file.read()
+
+        style_manager = StyleManager()
+        available_styles = style_manager.get_styles()
+
+        if not available_styles:
+            logger.warning("No styles available. Proceeding without style selection.")
+        else:
+            # Present style choices to the user
+            choices = style_manager.format_choices(available_styles)
+            questions = [
+                inquirer.List(
+                    "style",
+                    message="Select a style for the resume",
+                    choices=choices,
+                )
+            ]
+            style_answer = inquirer.prompt(questions)
+            if style_answer and "style" in style_answer:
+                selected_choice = style_answer["style"]
+                for style_name in available_styles:
+                    if selected_choice.startswith(style_name):
+                        style_manager.set_selected_style(style_name)
+                        logger.info(f"Selected style: {style_name}")
+                        break
+            else:
+                logger.warning("No style selected. Proceeding with default style.")
+        questions = [inquirer.Text('job_url', message="Please enter the URL of the job description")]
+        answers = inquirer.prompt(questions)
+        if not answers or not answers.get('job_url'):
+            logger.error("No job URL provided, exiting...")
+            return
+        job_url = answers['job_url']
+
+        resume_generator = ResumeGenerator()
+        resume_object = Resume(plain_text_resume)
+        driver = init_browser()
+
+        resume_generator.set_resume_object(resume_object)
+        resume_facade = ResumeFacade(
+            api_key=llm_api_key,
+            style_manager=style_manager,
+            resume_generator=resume_generator,
+            resume_object=resume_object,
+            output_path=Path("data_folder/output"),
+        )
+        resume_facade.set_driver(driver)
+        with resume_facade:
+            resume_facade.link_to_job(job_url)
+            resume_base64, cover_letter_base64, suggested_name = resume_facade.util_create_resume_and_cover_letter()
+
+        output_dir = Path(parameters["outputFileDirectory"]) / suggested_name
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        except IOError as e:
+            logger.error("Error creating output directory: %s", e)
+            raise
+
+        for file_name, result_base64 in (("resume.pdf", resume_base64), ("cover_letter.pdf", cover_letter_base64)):
+            try:
+                pdf_data = base64.b64decode(result_base64)
+            except base64.binascii.Error as e:
+                logger.error("Error decoding Base64: %s", e)
+                raise
+
+            output_path = output_dir / file_name
+            try:
+                with open(output_path, "wb") as file:
+                    file.write(pdf_data)
+                logger.info(f"Saved {file_name} at: {output_path}")
+            except IOError as e:
+                logger.error("Error writing file: %s", e)
+                raise
+    except Exception as e:
+        logger.exception(f"An error occurred while creating the CV and cover letter: {e}")
+        raise
+
+
 def create_resume_pdf(parameters: dict, llm_api_key: str):
     """
     Logic to create a CV.
@@ -442,8 +530,7 @@ def create_resume_pdf(parameters: dict, llm_api_key: str):
 
         # Making it headless, as it just generates the html and converts it to PDF
         options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        driver = init_browser(options=options)
+        options.add_argument('--headless=new')
 
         resume_generator.set_resume_object(resume_object)
 
@@ -455,8 +542,14 @@ def create_resume_pdf(parameters: dict, llm_api_key: str):
             resume_object=resume_object,
             output_path=Path("data_folder/output"),
         )
-        resume_facade.set_driver(driver)
-        result_base64 = resume_facade.create_resume_pdf()
+        with resume_facade, ThreadPoolExecutor(max_workers=1) as executor:
+            # The browser is only needed to print the PDF, so start and warm it up while the LLM writes the resume
+            driver_future = executor.submit(init_pdf_browser, options=options)
+            try:
+                resume_html = resume_facade.create_resume_html()
+            finally:
+                resume_facade.set_driver(driver_future.result())
+            result_base64 = resume_facade.render_pdf(resume_html)
 
         # Decode Base64 to binary data
         try:
@@ -525,6 +618,10 @@ def handle_inquiries(selected_actions: List[str], parameters: dict, llm_api_key:
                 # Measure time it takes to generate the resume
                 create_cover_letter(parameters, llm_api_key)
 
+            if "Generate Tailored Resume and Cover Letter for Job Description" == selected_actions:
+                print("Crafting a tailored resume and cover letter for your job application...")
+                create_resume_and_cover_letter_tailored(parameters, llm_api_key)
+
             end_time = time.time()
             execution_time = end_time - start_time
             print(f"\nTask completed in {format_execution_time(execution_time)}")
@@ -549,6 +646,7 @@ def prompt_user_action() -> str:
                     "Generate Resume",
                     "Generate Resume Tailored for Job Description",
                     "Generate Tailored Cover Letter for Job Description",
+                    "Generate Tailored Resume and Cover Letter for Job Description",
                 ],
             ),
         ]
@@ -602,11 +700,11 @@ def main():
         return 1
     except RuntimeError as re:
         logger.error(f"Runtime error: {re}")
-        logger.debug(traceback.format_exc())
+        # Only formatted when a sink accepts DEBUG records
+        logger.opt(exception=True).debug("Runtime error traceback")
         return 1
     except Exception as e:
         logger.exception(f"An unexpected error occurred: {e}")
-        logger.debug(traceback.format_exc())
         return 1
 
 if __name__ == "__main__":
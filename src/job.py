@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from src.logging import logger
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     role: str = ""
     company: str = ""
@@ -15,6 +15,10 @@ class GlobalConfig:
         self.API_KEY: str = None
         self.LLM_MODEL_TYPE: str = None
         self.LLM_MODEL: str = None
+        self.LLM_MODEL_CHEAP: str = None
+        self.LLM_EMBEDDINGS_TYPE: str = None
+        self.LLM_REQUESTS_PER_MINUTE: int = None
+        self.LLM_TOKENS_PER_MINUTE: int = None
         self.html_template = """
                             <!DOCTYPE html>
                             <html lang="en">
@@ -4,9 +4,9 @@ This creates the cover letter (in html, utils will then convert in PDF) matching
 # app/libs/resume_and_cover_builder/llm_generate_cover_letter_from_job.py
 import os
 import textwrap
+from functools import lru_cache
+from src.libs.resume_and_cover_builder.llm.llm_generate_resume import build_prompt, summarize_job_description
 from src.libs.resume_and_cover_builder.llm.llm_job_parser import LLMParser
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from pathlib import Path
 from dotenv import load_dotenv
 from pathlib import Path
@@ -28,6 +28,7 @@ class LLMCoverLetterJobDescription(LLMParser):
         self.strings = strings
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _preprocess_template_string(template: str) -> str:
         """
         Preprocess the template string by removing leading whitespace and indentation.
@@ -52,10 +53,9 @@ class LLMCoverLetterJobDescription(LLMParser):
         Args:
             job_description_text (str): The plain text job description to be used.
         """
-        prompt = ChatPromptTemplate.from_template(self.strings.summarize_prompt_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        output = chain.invoke({"text": job_description_text})
-        self.job_description = output
+        self.job_description = summarize_job_description(
+            self.llm_cheap, self.model_id, self.strings.summarize_prompt_template, job_description_text
+        )
 
     def generate_cover_letter(self) -> str:
         """
@@ -65,25 +65,23 @@ class LLMCoverLetterJobDescription(LLMParser):
         """
         logger.debug("Starting cover letter generation...")
         prompt_template = self._preprocess_template_string(self.strings.cover_letter_template)
-        logger.debug(f"Cover letter template after preprocessing: {prompt_template}")
+        logger.opt(lazy=True).debug("Cover letter template after preprocessing: {}", lambda: prompt_template)
 
-        prompt = ChatPromptTemplate.from_template(prompt_template)
-        logger.debug(f"Prompt created: {prompt}")
-
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        logger.debug(f"Chain created: {chain}")
+        prompt = build_prompt(prompt_template)
+        logger.opt(lazy=True).debug("Prompt created: {}", lambda: prompt)
 
         input_data = {
             "job_description": self.job_description,
             "resume": self.resume
         }
-        logger.debug(f"Input data: {input_data}")
+        logger.opt(lazy=True).debug("Input data: {}", lambda: input_data)
+
+        # Stream the reply so chunks are consumed as they arrive instead of buffering the whole response
+        output = "".join(self.llm_cheap.stream(prompt.invoke(input_data)))
 
-        output = chain.invoke(input_data)
-        
         # Remove all ```html tags from the output
         output = output.replace("```html", "").replace("```", "")
-        logger.debug(f"Cover letter generation result: {output}")
+        logger.opt(lazy=True).debug("Cover letter generation result: {}", lambda: output)
 
         logger.debug("Cover letter generation completed")
         return output
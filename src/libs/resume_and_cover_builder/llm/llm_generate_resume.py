@@ -2,17 +2,16 @@
 Create a class that generates a resume based on a resume and a resume template.
 """
 # app/libs/resume_and_cover_builder/gpt_resume.py
+import asyncio
 import os
 import textwrap
 from src.job import Job
+from src.libs.resume_and_cover_builder.llm_cache import LLMCache, cache_key
 from src.libs.resume_and_cover_builder.utils import LoggerChatModel
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_ollama import ChatOllama
 from dotenv import load_dotenv
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from loguru import logger
 from pathlib import Path
 
@@ -26,30 +25,97 @@ if not os.path.exists(log_folder):
 log_path = Path(log_folder).resolve()
 logger.add(log_path / "gpt_resume.log", rotation="1 day", compression="zip", retention="7 days", level="DEBUG")
 
+@lru_cache(maxsize=32)
+def build_prompt(template: str) -> ChatPromptTemplate:
+    """
+    Parse a prompt template into a ChatPromptTemplate.
+    Templates are module-level constants, so each one is parsed only once per run.
+    Args:
+        template (str): The template string to parse.
+    Returns:
+        ChatPromptTemplate: The parsed prompt template.
+    """
+    return ChatPromptTemplate.from_template(template)
+
+_summary_cache = None
+
+def summarize_job_description(llm, model_id: str, template: str, job_description_text: str) -> str:
+    """
+    Summarize a job description, reusing a previous summary of the same text when one is cached.
+    Both the resume and the cover letter pipelines summarize the job first, so a run of both on the
+    same posting, or a re-run, only pays for the summarization once.
+    Args:
+        llm: The chat model used to summarize on a cache miss.
+        model_id (str): Identifies that model, so changing the model does not reuse its old summaries.
+        template (str): The summarization prompt template.
+        job_description_text (str): The plain text job description.
+    Returns:
+        str: The summarized job description.
+    """
+    global _summary_cache
+    if _summary_cache is None:
+        _summary_cache = LLMCache("job_summaries")
+    key = cache_key(model_id, template, job_description_text)
+    summary = _summary_cache.get(key)
+    if summary is not None:
+        logger.debug("Using cached job description summary")
+        return summary
+    chain = build_prompt(template) | llm | StrOutputParser()
+    summary = chain.invoke({"text": job_description_text})
+    _summary_cache.set(key, summary)
+    return summary
+
+def _create_openai_llm(model_name: str, api_key: str, temperature: float):
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(
+        model_name=model_name,
+        openai_api_key=api_key,
+        temperature=temperature
+    )
+
+def _create_gemini_llm(model_name: str, api_key: str, temperature: float):
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=model_name,
+        google_api_key=api_key,
+        temperature=temperature
+    )
+
+def _create_ollama_llm(model_name: str, api_key: str, temperature: float):
+    from langchain_ollama import ChatOllama
+
+    return ChatOllama(
+        model=model_name,
+        temperature=temperature
+    )
+
 class LLMModelFactory:
+    # Provider modules are imported only when their model type is requested
+    _BUILDERS = {
+        "openai": _create_openai_llm,
+        "gemini": _create_gemini_llm,
+        "ollama": _create_ollama_llm,
+    }
+
     @staticmethod
     def create_llm(model_type: str, model_name: str, api_key: str = None, **kwargs):
-        model_type = model_type.lower()
-        
-        if model_type == "openai":
-            return ChatOpenAI(
-                model_name=model_name,
-                openai_api_key=api_key,
-                temperature=kwargs.get('temperature', 0.4)
-            )
-        elif model_type == "gemini":
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                google_api_key=api_key,
-                temperature=kwargs.get('temperature', 0.4)
-            )
-        elif model_type == "ollama":
-            return ChatOllama(
-                model=model_name,
-                temperature=kwargs.get('temperature', 0.4)
-            )
-        else:
+        return LLMModelFactory._create_llm(
+            model_type.lower(), model_name, api_key, kwargs.get('temperature', 0.4)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _create_llm(model_type: str, model_name: str, api_key: str, temperature: float):
+        """
+        Build (once per distinct configuration) the chat model client for the given provider.
+        The client is shared by every LLMResumer/LLMParser instance using the same settings.
+        """
+        builder = LLMModelFactory._BUILDERS.get(model_type)
+        if builder is None:
             raise ValueError(f"Unsupported model type: {model_type}")
+        return builder(model_name, api_key, temperature)
 
 class LLMResumer:
     def __init__(self, config, strings):
@@ -64,9 +130,13 @@ class LLMResumer:
             temperature=0.4
         )
         self.llm_cheap = LoggerChatModel(llm)
+        self.model_id = f"{model_type}:{model_name}"
+        # Section chains use this so they can be awaited (see agenerate_all_sections)
+        self.llm_runnable = self.llm_cheap.as_runnable()
         self.strings = strings
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _preprocess_template_string(template: str) -> str:
         """
         Preprocess the template string by removing leading whitespace and indentation.
@@ -85,190 +155,215 @@ class LLMResumer:
         """
         self.resume = resume
 
-    def generate_header(self, data = None) -> str:
+    @staticmethod
+    def _invoke_section(chain, input_data) -> str:
+        output = chain.invoke(input_data)
+        logger.opt(lazy=True).debug("Chain invocation result: {}", lambda: output)
+        return output
+
+    def _prepare_header(self, data = None) -> tuple:
         """
-        Generate the header section of the resume.
+        Build the chain and input for the header section of the resume.
         Args:
             data (dict): The personal information to use for generating the header.
         Returns:
-            str: The generated header section.
+            tuple: The chain and its input data.
         """
         header_prompt_template = self._preprocess_template_string(
             self.strings.prompt_header
         )
-        prompt = ChatPromptTemplate.from_template(header_prompt_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        prompt = build_prompt(header_prompt_template)
+        chain = prompt | self.llm_runnable | StrOutputParser()
         input_data = {
             "personal_information": self.resume.personal_information
         } if data is None else data
-        output = chain.invoke(input_data)
-        return output
+        return chain, input_data
+
+    def generate_header(self, data = None) -> str:
+        """
+        Generate the header section of the resume.
+        Args:
+            data (dict): The personal information to use for generating the header.
+        Returns:
+            str: The generated header section.
+        """
+        return self._invoke_section(*self._prepare_header(data))
     
-    def generate_education_section(self, data = None) -> str:
+    def _prepare_education_section(self, data = None) -> tuple:
         """
-        Generate the education section of the resume.
+        Build the chain and input for the education section of the resume.
         Args:
             data (dict): The education details to use for generating the education section.
         Returns:
-            str: The generated education section.
+            tuple: The chain and its input data.
         """
-        logger.debug("Starting education section generation")
-
         education_prompt_template = self._preprocess_template_string(self.strings.prompt_education)
-        logger.debug(f"Education template: {education_prompt_template}")
+        logger.opt(lazy=True).debug("Education template: {}", lambda: education_prompt_template)
 
-        prompt = ChatPromptTemplate.from_template(education_prompt_template)
-        logger.debug(f"Prompt: {prompt}")
-        
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        logger.debug(f"Chain created: {chain}")
+        prompt = build_prompt(education_prompt_template)
+        chain = prompt | self.llm_runnable | StrOutputParser()
+        logger.opt(lazy=True).debug("Chain created: {}", lambda: chain)
         
         input_data = {
             "education_details": self.resume.education_details
         } if data is None else data
-        output = chain.invoke(input_data)
-        logger.debug(f"Chain invocation result: {output}")
+        return chain, input_data
 
-        logger.debug("Education section generation completed")
-        return output
+    def generate_education_section(self, data = None) -> str:
+        """
+        Generate the education section of the resume.
+        Args:
+            data (dict): The education details to use for generating the education section.
+        Returns:
+            str: The generated education section.
+        """
+        return self._invoke_section(*self._prepare_education_section(data))
 
-    def generate_work_experience_section(self, data = None) -> str:
+    def _prepare_work_experience_section(self, data = None) -> tuple:
         """
-        Generate the work experience section of the resume.
+        Build the chain and input for the work experience section of the resume.
         Args:
             data (dict): The work experience details to use for generating the work experience section.
         Returns:
-            str: The generated work experience section.
+            tuple: The chain and its input data.
         """
-        logger.debug("Starting work experience section generation")
-
         work_experience_prompt_template = self._preprocess_template_string(self.strings.prompt_working_experience)
-        logger.debug(f"Work experience template: {work_experience_prompt_template}")
+        logger.opt(lazy=True).debug("Work experience template: {}", lambda: work_experience_prompt_template)
 
-        prompt = ChatPromptTemplate.from_template(work_experience_prompt_template)
-        logger.debug(f"Prompt: {prompt}")
-        
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        logger.debug(f"Chain created: {chain}")
+        prompt = build_prompt(work_experience_prompt_template)
+        chain = prompt | self.llm_runnable | StrOutputParser()
+        logger.opt(lazy=True).debug("Chain created: {}", lambda: chain)
         
         input_data = {
             "experience_details": self.resume.experience_details
         } if data is None else data
-        output = chain.invoke(input_data)
-        logger.debug(f"Chain invocation result: {output}")
+        return chain, input_data
 
-        logger.debug("Work experience section generation completed")
-        return output
+    def generate_work_experience_section(self, data = None) -> str:
+        """
+        Generate the work experience section of the resume.
+        Args:
+            data (dict): The work experience details to use for generating the work experience section.
+        Returns:
+            str: The generated work experience section.
+        """
+        return self._invoke_section(*self._prepare_work_experience_section(data))
 
-    def generate_projects_section(self, data = None) -> str:
+    def _prepare_projects_section(self, data = None) -> tuple:
         """
-        Generate the side projects section of the resume.
+        Build the chain and input for the side projects section of the resume.
         Args:
             data (dict): The side projects to use for generating the side projects section.
         Returns:
-            str: The generated side projects section.
+            tuple: The chain and its input data.
         """
-        logger.debug("Starting side projects section generation")
-
         projects_prompt_template = self._preprocess_template_string(self.strings.prompt_projects)
-        logger.debug(f"Side projects template: {projects_prompt_template}")
+        logger.opt(lazy=True).debug("Side projects template: {}", lambda: projects_prompt_template)
 
-        prompt = ChatPromptTemplate.from_template(projects_prompt_template)
-        logger.debug(f"Prompt: {prompt}")
-        
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        logger.debug(f"Chain created: {chain}")
+        prompt = build_prompt(projects_prompt_template)
+        chain = prompt | self.llm_runnable | StrOutputParser()
+        logger.opt(lazy=True).debug("Chain created: {}", lambda: chain)
         
         input_data = {
             "projects": self.resume.projects
         } if data is None else data
-        output = chain.invoke(input_data)
-        logger.debug(f"Chain invocation result: {output}")
+        return chain, input_data
 
-        logger.debug("Side projects section generation completed")
-        return output
+    def generate_projects_section(self, data = None) -> str:
+        """
+        Generate the side projects section of the resume.
+        Args:
+            data (dict): The side projects to use for generating the side projects section.
+        Returns:
+            str: The generated side projects section.
+        """
+        return self._invoke_section(*self._prepare_projects_section(data))
 
-    def generate_achievements_section(self, data = None) -> str:
+    def _prepare_achievements_section(self, data = None) -> tuple:
         """
-        Generate the achievements section of the resume.
+        Build the chain and input for the achievements section of the resume.
         Args:
             data (dict): The achievements to use for generating the achievements section.
         Returns:
-            str: The generated achievements section.
+            tuple: The chain and its input data.
         """
-        logger.debug("Starting achievements section generation")
-
         achievements_prompt_template = self._preprocess_template_string(self.strings.prompt_achievements)
-        logger.debug(f"Achievements template: {achievements_prompt_template}")
-
-        prompt = ChatPromptTemplate.from_template(achievements_prompt_template)
-        logger.debug(f"Prompt: {prompt}")
+        logger.opt(lazy=True).debug("Achievements template: {}", lambda: achievements_prompt_template)
 
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        logger.debug(f"Chain created: {chain}")
+        prompt = build_prompt(achievements_prompt_template)
+        chain = prompt | self.llm_runnable | StrOutputParser()
+        logger.opt(lazy=True).debug("Chain created: {}", lambda: chain)
 
         input_data = {
             "achievements": self.resume.achievements,
             "certifications": self.resume.certifications,
         } if data is None else data
-        logger.debug(f"Input data for the chain: {input_data}")
-
-        output = chain.invoke(input_data)
-        logger.debug(f"Chain invocation result: {output}")
+        logger.opt(lazy=True).debug("Input data for the chain: {}", lambda: input_data)
+        return chain, input_data
 
-        logger.debug("Achievements section generation completed")
-        return output
-
-    def generate_certifications_section(self, data = None) -> str:
+    def generate_achievements_section(self, data = None) -> str:
         """
-        Generate the certifications section of the resume.
+        Generate the achievements section of the resume.
+        Args:
+            data (dict): The achievements to use for generating the achievements section.
         Returns:
-            str: The generated certifications section.
+            str: The generated achievements section.
         """
-        logger.debug("Starting Certifications section generation")
+        return self._invoke_section(*self._prepare_achievements_section(data))
 
+    def _prepare_certifications_section(self, data = None) -> tuple:
+        """
+        Build the chain and input for the certifications section of the resume.
+        Returns:
+            tuple: The chain and its input data.
+        """
         certifications_prompt_template = self._preprocess_template_string(self.strings.prompt_certifications)
-        logger.debug(f"Certifications template: {certifications_prompt_template}")
-
-        prompt = ChatPromptTemplate.from_template(certifications_prompt_template)
-        logger.debug(f"Prompt: {prompt}")
+        logger.opt(lazy=True).debug("Certifications template: {}", lambda: certifications_prompt_template)
 
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        logger.debug(f"Chain created: {chain}")
+        prompt = build_prompt(certifications_prompt_template)
+        chain = prompt | self.llm_runnable | StrOutputParser()
+        logger.opt(lazy=True).debug("Chain created: {}", lambda: chain)
 
         input_data = {
             "certifications": self.resume.certifications
         } if data is None else data
-        logger.debug(f"Input data for the chain: {input_data}")
+        logger.opt(lazy=True).debug("Input data for the chain: {}", lambda: input_data)
+        return chain, input_data
 
-        output = chain.invoke(input_data)
-        logger.debug(f"Chain invocation result: {output}")
-
-        logger.debug("Certifications section generation completed")
-        return output
+    def generate_certifications_section(self, data = None) -> str:
+        """
+        Generate the certifications section of the resume.
+        Returns:
+            str: The generated certifications section.
+        """
+        return self._invoke_section(*self._prepare_certifications_section(data))
     
-    def generate_additional_skills_section(self, data = None) -> str:
+    def _prepare_additional_skills_section(self, data = None) -> tuple:
         """
-        Generate the additional skills section of the resume.
+        Build the chain and input for the additional skills section of the resume.
         Returns:
-            str: The generated additional skills section.
+            tuple: The chain and its input data.
         """
         template = self.strings.prompt_additional_skills if data is None else self.strings.prompt_relevant_skills
         additional_skills_prompt_template = self._preprocess_template_string(template)
         
-        if self.resume.experience_details:
+        # Merge the skills acquired in each job into a copy: the resume object is shared with the cover letter,
+        # which may be generated at the same time, so it must not be mutated here
+        skills = self.resume.skills
+        if self.resume.experience_details and isinstance(skills, set):
+            skills = set(skills)
             for exp in self.resume.experience_details:
                 if exp.skills_acquired:
-                    self.resume.skills.update(exp.skills_acquired)
+                    skills.update(exp.skills_acquired)
 
-        prompt = ChatPromptTemplate.from_template(additional_skills_prompt_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        prompt = build_prompt(additional_skills_prompt_template)
+        chain = prompt | self.llm_runnable | StrOutputParser()
 
         if data is not None:
             languages = ', '.join([f"{lang.language} - {lang.proficiency}".strip() for lang in data['languages']]) if data['languages'] else ''
             interests = ', '.join(data['interests']).strip() if isinstance(data['interests'], list) else data['interests']
             requirements = ', '.join(data['job_requirements']).strip() if isinstance(data['job_requirements'], list) else data['job_requirements']
-            skills = ', '.join(sorted(list(self.resume.skills))).strip() if isinstance(self.resume.skills, set) else ', '.join(self.resume.skills).strip() if isinstance(self.resume.skills, list) else self.resume.skills
+            skills = ', '.join(sorted(list(skills))).strip() if isinstance(skills, set) else ', '.join(skills).strip() if isinstance(skills, list) else skills
             
             input_data = {
                 "job_requirements": requirements,
@@ -278,95 +373,107 @@ class LLMResumer:
             }
         else: 
             input_data = {
-                "skills": self.resume.skills,
+                "skills": skills,
                 "interests": self.resume.interests,
                 "languages": self.resume.languages,
             }
-        output = chain.invoke(input_data)
-        
-        return output
+        return chain, input_data
 
-    def generate_html_resume(self, job: Job = None) -> str:
+    def generate_additional_skills_section(self, data = None) -> str:
         """
-        Generate the full HTML resume based on the resume object.
+        Generate the additional skills section of the resume.
         Returns:
-            str: The generated HTML resume.
+            str: The generated additional skills section.
+        """
+        return self._invoke_section(*self._prepare_additional_skills_section(data))
+
+    def _section_requests(self, job: Job = None) -> dict:
+        """
+        Build the chain and input of every section the resume has data for.
+        Args:
+            job (Job): The job to tailor the additional skills section to, if any.
+        Returns:
+            dict: The (chain, input data) pairs keyed by section name.
         """
         if not self.resume:
             logger.error("The resume object is not set, set with `gpt_answerer.set_resume(self.resume_object)`.")
             raise ValueError("The resume object is not set.")
 
-        def header_fn():
-            if self.resume.personal_information:
-                return self.generate_header()
-            return ""
-
-        def education_fn():
-            if self.resume.education_details:
-                return self.generate_education_section()
-            return ""
-
-        def work_experience_fn():
-            if self.resume.experience_details:
-                return self.generate_work_experience_section()
-            return ""
-
-        def projects_fn():
-            if self.resume.projects:
-                return self.generate_projects_section()
-            return ""
-
-        def achievements_fn():
-            if self.resume.achievements:
-                return self.generate_achievements_section()
-            return ""
-        
-        def certifications_fn():
-            if self.resume.certifications:
-                return self.generate_certifications_section()
-            return ""
-
-        def additional_skills_fn():
-            nonlocal job
-            if job is not None and isinstance(job, Job):
-                if (self.resume.experience_details or self.resume.education_details or
-                    self.resume.languages or self.resume.interests or self.resume.skills):
-                    # According to the provided Job object, generate the additional skills section in JSON format
-                    job = {
-                        "interests": self.resume.interests,
-                        "job_requirements": job.requirements,
-                        "languages": self.resume.languages,
-                    } 
-                    return self.generate_additional_skills_section(job)
-            else:
-                if (self.resume.experience_details or self.resume.education_details or
-                    self.resume.languages or self.resume.interests):
-                    return self.generate_additional_skills_section()
-            return ""
-
-        # Create a dictionary to map the function names to their respective callables
-        functions = {
-            "header": header_fn,
-            "education": education_fn,
-            "work_experience": work_experience_fn,
-            "projects": projects_fn,
-            "achievements": achievements_fn,
-            "certifications": certifications_fn,
-            "additional_skills": additional_skills_fn,
-        }
-
-        # Use ThreadPoolExecutor to run the functions in parallel
-        with ThreadPoolExecutor() as executor:
-            future_to_section = {executor.submit(fn): section for section, fn in functions.items()}
-            results = {}
-            for future in as_completed(future_to_section):
-                section = future_to_section[future]
-                try:
-                    result = future.result()
-                    if result:
-                        results[section] = result
-                except Exception as exc:
-                    logger.error(f'{section} raised an exception: {exc}')
+        builders = {}
+        if self.resume.personal_information:
+            builders["header"] = self._prepare_header
+        if self.resume.education_details:
+            builders["education"] = self._prepare_education_section
+        if self.resume.experience_details:
+            builders["work_experience"] = self._prepare_work_experience_section
+        if self.resume.projects:
+            builders["projects"] = self._prepare_projects_section
+        if self.resume.achievements:
+            builders["achievements"] = self._prepare_achievements_section
+        if self.resume.certifications:
+            builders["certifications"] = self._prepare_certifications_section
+
+        if job is not None and isinstance(job, Job):
+            if (self.resume.experience_details or self.resume.education_details or
+                self.resume.languages or self.resume.interests or self.resume.skills):
+                # According to the provided Job object, generate the additional skills section in JSON format
+                builders["additional_skills"] = lambda: self._prepare_additional_skills_section({
+                    "interests": self.resume.interests,
+                    "job_requirements": job.requirements,
+                    "languages": self.resume.languages,
+                })
+        elif (self.resume.experience_details or self.resume.education_details or
+              self.resume.languages or self.resume.interests):
+            builders["additional_skills"] = self._prepare_additional_skills_section
+
+        # A section that fails to build is left out, like a section whose LLM call fails
+        requests = {}
+        for section, build in builders.items():
+            try:
+                requests[section] = build()
+            except Exception as exc:
+                logger.error(f'{section} raised an exception: {exc}')
+        return requests
+
+    async def agenerate_all_sections(self, job: Job = None) -> dict:
+        """
+        Generate every resume section concurrently, one LLM call per section awaited on the event loop.
+        Args:
+            job (Job): The job to tailor the additional skills section to, if any.
+        Returns:
+            dict: The generated sections keyed by section name; empty or failed sections are omitted.
+        """
+        requests = self._section_requests(job)
+        # The chains go through LoggerChatModel.acall, so the calls overlap without a thread per section
+        outputs = await asyncio.gather(
+            *(chain.ainvoke(input_data) for chain, input_data in requests.values()),
+            return_exceptions=True
+        )
+        results = {}
+        for section, result in zip(requests, outputs):
+            if isinstance(result, Exception):
+                logger.error(f'{section} raised an exception: {result}')
+            elif result:
+                results[section] = result
+        return results
+
+    def generate_all_sections(self, job: Job = None) -> dict:
+        """
+        Blocking wrapper around agenerate_all_sections, for callers without a running event loop.
+        Args:
+            job (Job): The job to tailor the additional skills section to, if any.
+        Returns:
+            dict: The generated sections keyed by section name; empty or failed sections are omitted.
+        """
+        return asyncio.run(self.agenerate_all_sections(job))
+
+    def generate_html_resume(self, job: Job = None) -> str:
+        """
+        Generate the full HTML resume based on the resume object.
+        Returns:
+            str: The generated HTML resume.
+        """
+        results = self.generate_all_sections(job)
         full_resume = "<body>\n"
         full_resume += f"  {results.get('header', '')}\n"
         full_resume += "  <main>\n"
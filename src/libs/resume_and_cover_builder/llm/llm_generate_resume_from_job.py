@@ -3,10 +3,9 @@ Create a class that generates a job description based on a resume and a job desc
 """
 # app/libs/resume_and_cover_builder/llm_generate_resume_from_job.py
 import os
-from src.libs.resume_and_cover_builder.llm.llm_generate_resume import LLMResumer
+from src.libs.resume_and_cover_builder.llm.llm_generate_resume import LLMResumer, build_prompt, summarize_job_description
 # from src.libs.resume_and_cover_builder.llm.llm_job_parser import LLMParser
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from dotenv import load_dotenv
 from loguru import logger
 from pathlib import Path
@@ -30,73 +29,72 @@ class LLMResumeJobDescription(LLMResumer):
         Args:
             job_description_text (str): The plain text job description to be used.
         """
-        prompt = ChatPromptTemplate.from_template(self.strings.summarize_prompt_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        output = chain.invoke({"text": job_description_text})
-        self.job_description = output
+        self.job_description = summarize_job_description(
+            self.llm_cheap, self.model_id, self.strings.summarize_prompt_template, job_description_text
+        )
     
-    def generate_header(self) -> str:
+    def _prepare_header(self, data = None) -> tuple:
         """
-        Generate the header section of the resume.
+        Build the chain and input for the header section of the resume, tailored to the job description.
         Returns:
-            str: The generated header section.
+            tuple: The chain and its input data.
         """
-        return super().generate_header(data={
+        return super()._prepare_header(data=data or {
             "personal_information": self.resume.personal_information,
             "job_description": self.job_description
         })
 
-    def generate_education_section(self) -> str:
+    def _prepare_education_section(self, data = None) -> tuple:
         """
-        Generate the education section of the resume.
+        Build the chain and input for the education section of the resume, tailored to the job description.
         Returns:
-            str: The generated education section.
+            tuple: The chain and its input data.
         """
-        return super().generate_education_section(data={
+        return super()._prepare_education_section(data=data or {
             "education_details": self.resume.education_details,
             "job_description": self.job_description
         })
 
-    def generate_work_experience_section(self) -> str:
+    def _prepare_work_experience_section(self, data = None) -> tuple:
         """
-        Generate the work experience section of the resume.
+        Build the chain and input for the work experience section of the resume, tailored to the job description.
         Returns:
-            str: The generated work experience section.
+            tuple: The chain and its input data.
         """
-        return super().generate_work_experience_section(data={
+        return super()._prepare_work_experience_section(data=data or {
             "experience_details": self.resume.experience_details,
             "job_description": self.job_description
         })
 
-    def generate_projects_section(self) -> str:
+    def _prepare_projects_section(self, data = None) -> tuple:
         """
-        Generate the side projects section of the resume.
+        Build the chain and input for the side projects section of the resume, tailored to the job description.
         Returns:
-            str: The generated side projects section.
+            tuple: The chain and its input data.
         """
-        return super().generate_projects_section(data={
+        return super()._prepare_projects_section(data=data or {
             "projects": self.resume.projects,
             "job_description": self.job_description
         })
 
-    def generate_achievements_section(self) -> str:
+    def _prepare_achievements_section(self, data = None) -> tuple:
         """
-        Generate the achievements section of the resume.
+        Build the chain and input for the achievements section of the resume, tailored to the job description.
         Returns:
-            str: The generated achievements section.
+            tuple: The chain and its input data.
         """
-        return super().generate_achievements_section(data={
+        return super()._prepare_achievements_section(data=data or {
             "achievements": self.resume.achievements,
             "job_description": self.job_description
         })
 
-    def generate_certifications_section(self) -> str:
+    def _prepare_certifications_section(self, data = None) -> tuple:
         """
-        Generate the certifications section of the resume.
+        Build the chain and input for the certifications section of the resume, tailored to the job description.
         Returns:
-            str: The generated certifications section.
+            tuple: The chain and its input data.
         """
-        return super().generate_certifications_section(data={
+        return super()._prepare_certifications_section(data=data or {
             "certifications": self.resume.certifications,
             "job_description": self.job_description
         })
@@ -105,8 +103,8 @@ class LLMResumeJobDescription(LLMResumer):
         relevant_skills_prompt_template = self._preprocess_template_string(
             self.strings.prompt_relevant_skills
         )
-        prompt = ChatPromptTemplate.from_template(relevant_skills_prompt_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        prompt = build_prompt(relevant_skills_prompt_template)
+        chain = prompt | self.llm_runnable | StrOutputParser()
         output = chain.invoke({
             "job_requirements": job_skills,
             "skills": self.resume.skills,
@@ -1,25 +1,27 @@
-import json
+import hashlib
+import importlib.util
 import os
-import tempfile
 import textwrap
 import re
+import warnings
+from contextlib import closing, contextmanager
+from functools import lru_cache
 from typing import Dict, Optional  # For email validation
-import numpy as np
+import json_repair
+import orjson
 from src.libs.resume_and_cover_builder.llm.llm_generate_resume import LLMModelFactory
+from src.libs.resume_and_cover_builder.llm_cache import CACHE_DIRECTORY, LLMCache, cache_key
 from src.libs.resume_and_cover_builder.utils import LoggerChatModel
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
 from dotenv import load_dotenv
 from loguru import logger
 from pathlib import Path
-from langchain_text_splitters import TokenTextSplitter
-from langchain_community.vectorstores import FAISS
-from langchain_community.document_loaders import TextLoader
+from selectolax.lexbor import LexborHTMLParser
 # from requests.exceptions import HTTPError as HTTPStatusError  # HTTP error handling
 
 # Embeddings
-from langchain_ollama import OllamaEmbeddings
-from langchain_community.embeddings import OpenAIEmbeddings, HuggingFaceEmbeddings
+from langchain_core.embeddings import Embeddings
 
 # Load environment variables from the .env file
 load_dotenv()
@@ -31,6 +33,52 @@ if not os.path.exists(log_folder):
 log_path = Path(log_folder).resolve()
 logger.add(log_path / "gpt_resume.log", rotation="1 day", compression="zip", retention="7 days", level="DEBUG")
 
+# Small quantized model that runs on CPU through ONNX Runtime
+FASTEMBED_MODEL = "BAAI/bge-small-en-v1.5"
+
+# Markdown code fences (optionally tagged json/html) wrapped around LLM replies
+_CODE_FENCE_RE = re.compile(r'```(?:json|html)?\n?')
+_JSON_BLOB_RE = re.compile(r'\{.*\}', re.DOTALL)
+# Loose email shape check for the extracted recruiter email
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+
+# Postings up to this many tokens are passed to the LLM whole instead of being indexed for retrieval
+MAX_CAG_TOKENS = 12000
+
+# FAISS indexes saved by earlier runs, one directory per page hash
+FAISS_CACHE_DIRECTORY = CACHE_DIRECTORY / "faiss"
+
+# Vectorstores already built in this process, keyed by a hash of the embeddings and page text
+_vectorstore_cache: Dict[str, object] = {}
+
+# tiktoken, the text splitter and FAISS are slow to import, so they are only loaded once a posting is parsed.
+# The encoding and splitter are built once per process, constructing them is not free.
+@lru_cache(maxsize=None)
+def _get_encoding():
+    import tiktoken
+
+    return tiktoken.get_encoding("cl100k_base")
+
+@lru_cache(maxsize=None)
+def _get_text_splitter():
+    from langchain_text_splitters import TokenTextSplitter
+
+    return TokenTextSplitter(encoding_name="cl100k_base", chunk_size=500, chunk_overlap=50)
+
+def _faiss_kwargs() -> dict:
+    # Embedding models are trained for cosine similarity: normalize vectors and rank by inner product
+    from langchain_community.vectorstores.utils import DistanceStrategy
+
+    return {"normalize_L2": True, "distance_strategy": DistanceStrategy.MAX_INNER_PRODUCT}
+
+@contextmanager
+def _ignore_faiss_normalize_warning():
+    # LangChain's FAISS warns that normalize_L2 does not apply to inner product, but it still normalizes
+    # the vectors, which is what makes the inner product a cosine similarity. The warning is noise here.
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Normalizing L2 is not applicable")
+        yield
+
 
 class LLMParser:
     def __init__(self, config):
@@ -46,18 +94,84 @@ class LLMParser:
             temperature=0.4
         )
         self.llm_cheap = LoggerChatModel(self.llm)
+        self.model_id = f"{model_type}:{model_name}"
+        # Extraction is deterministic and needs no creativity, so use the cheap model at temperature 0
+        self.extract_model_name = getattr(config, 'LLM_MODEL_CHEAP', None) or model_name
+        self.llm_extract = LoggerChatModel(LLMModelFactory.create_llm(
+            model_type=model_type,
+            model_name=self.extract_model_name,
+            api_key=api_key,
+            temperature=0
+        ))
+        # Temperature-0 answers are reproducible, so they are kept across runs
+        self._extraction_cache = LLMCache("extractions")
 
-        # Initialize embeddings based on model type
+        # Embeddings are only created once an index is built or loaded (see llm_embeddings), preferring
+        # local FastEmbed when configured and installed
+        self._use_fastembed = (
+            getattr(config, 'LLM_EMBEDDINGS_TYPE', None) == 'fastembed'
+            and importlib.util.find_spec("fastembed") is not None
+        )
+        self._embeddings_config = (self._use_fastembed, model_type, model_name, api_key)
+
+        self.vectorstore = None  # Will be initialized after document loading
+        self._full_text: Optional[str] = None  # Set instead of the vectorstore when the posting fits in the prompt
+        self._cache_key = None
+        self._context_cache: Dict[tuple, str] = {}
+        self._details_cache: Optional[Dict[str, Optional[str]]] = None
+
+    @property
+    def llm_embeddings(self) -> Embeddings:
+        """
+        The embeddings used to index long postings. Loading them can be slow (FastEmbed loads an ONNX
+        model), and postings that fit in the prompt never need them, so they are created on first use.
+        """
+        return self._get_embeddings(*self._embeddings_config)
+
+    def _embeddings_id(self) -> str:
+        # Identifies the embeddings an index is built with, without loading them
+        use_fastembed, model_type, model_name, _ = self._embeddings_config
+        return f"fastembed:{FASTEMBED_MODEL}" if use_fastembed else f"{model_type}:{model_name}"
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_embeddings(use_fastembed: bool, model_type: str, model_name: str, api_key: str) -> Embeddings:
+        """
+        Build (once per distinct configuration) the embeddings, shared by every LLMParser instance.
+        """
+        embeddings = LLMParser._create_fastembed_embeddings() if use_fastembed else None
+        if embeddings is None:
+            embeddings = LLMParser._create_embeddings(model_type, model_name, api_key)
+        return embeddings
+
+    @staticmethod
+    def _create_embeddings(model_type: str, model_name: str, api_key: str) -> Embeddings:
+        """
+        Create the embeddings that match the chat model type.
+        """
         if model_type == 'openai':
-            self.llm_embeddings = OpenAIEmbeddings(openai_api_key=api_key)
+            from langchain_community.embeddings import OpenAIEmbeddings
+            return OpenAIEmbeddings(openai_api_key=api_key)
         elif model_type == 'huggingface':
-            self.llm_embeddings = HuggingFaceEmbeddings(model_name=model_name)
+            from langchain_community.embeddings import HuggingFaceEmbeddings
+            return HuggingFaceEmbeddings(model_name=model_name)
         elif model_type == 'ollama' or model_type == 'gemini':
-            self.llm_embeddings = OllamaEmbeddings(model='nomic-embed-text:latest')
+            from langchain_ollama import OllamaEmbeddings
+            return OllamaEmbeddings(model='nomic-embed-text:latest')
         else:
             raise ValueError(f"Unsupported model type for embeddings: {model_type}")
 
-        self.vectorstore = None  # Will be initialized after document loading
+    @staticmethod
+    def _create_fastembed_embeddings() -> Optional[Embeddings]:
+        """
+        Create local ONNX embeddings with FastEmbed, or return None if fastembed is not installed.
+        """
+        try:
+            from langchain_community.embeddings import FastEmbedEmbeddings
+            return FastEmbedEmbeddings(model_name=FASTEMBED_MODEL)
+        except ImportError:
+            logger.warning("fastembed is not installed, falling back to the model type embeddings.")
+            return None
 
     @staticmethod
     def _preprocess_template_string(template: str) -> str:
@@ -73,56 +187,93 @@ class LLMParser:
     def set_body_html(self, body_html):
         """
         Retrieves the job description from HTML, processes it, and initializes the vectorstore.
+        Postings short enough to fit in the prompt are kept as plain text and not indexed at all.
         Args:
             body_html (str): The HTML content to process.
         """
+        self._context_cache = {}
+        self._details_cache = None
+        self._full_text = None
+        self.vectorstore = None
 
-        # Save the HTML content to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".html", mode="w", encoding="utf-8") as temp_file:
-            temp_file.write(body_html)
-            temp_file_path = temp_file.name 
-        try:
-            loader = TextLoader(temp_file_path, encoding="utf-8", autodetect_encoding=True)
-            document = loader.load()
-            logger.debug("Document successfully loaded.")
-        except Exception as e:
-            logger.error(f"Error during document loading: {e}")
-            raise
-        finally:
-            os.remove(temp_file_path)
-            logger.debug(f"Temporary file removed: {temp_file_path}")
+        text = self.remove_html_tags(body_html)
+        token_count = len(_get_encoding().encode(text))
+        if token_count < MAX_CAG_TOKENS:
+            self._full_text = text
+            logger.debug(f"Posting has {token_count} tokens, skipping the vectorstore.")
+            return
+
+        self._cache_key = hashlib.blake2b(
+            f"{self._embeddings_id()}\0{text}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        if self._cache_key in _vectorstore_cache:
+            self.vectorstore = _vectorstore_cache[self._cache_key]
+            logger.debug("Reusing vectorstore built for identical page content.")
+            return
+
+        from langchain_community.vectorstores import FAISS
+
+        faiss_cache_path = FAISS_CACHE_DIRECTORY / self._cache_key
+        if faiss_cache_path.exists():
+            try:
+                # The index was written by this application, so loading its pickled docstore is safe
+                with _ignore_faiss_normalize_warning():
+                    self.vectorstore = FAISS.load_local(
+                        str(faiss_cache_path), self.llm_embeddings, allow_dangerous_deserialization=True, **_faiss_kwargs()
+                    )
+                _vectorstore_cache[self._cache_key] = self.vectorstore
+                logger.debug(f"Vectorstore loaded from {faiss_cache_path}.")
+                return
+            except Exception as e:
+                logger.warning(f"Failed to load cached vectorstore, rebuilding it: {e}")
+
+        # Index the text already stripped of HTML, so chunks carry fewer tokens and retrieval returns clean context
+        document = [Document(page_content=text)]
         
         # Split the text into chunks
-        text_splitter = TokenTextSplitter(chunk_size=500, chunk_overlap=50)
-        all_splits = text_splitter.split_documents(document)
+        all_splits = _get_text_splitter().split_documents(document)
         logger.debug(f"Text split into {len(all_splits)} fragments.")
         
         # Create the vectorstore using FAISS
         try:
-            if isinstance(self.llm_embeddings, (OpenAIEmbeddings, HuggingFaceEmbeddings, OllamaEmbeddings)):
+            if isinstance(self.llm_embeddings, Embeddings):
                 # Standard approach for OpenAI and HuggingFace
-                self.vectorstore = FAISS.from_documents(documents=all_splits, embedding=self.llm_embeddings)
+                with _ignore_faiss_normalize_warning():
+                    self.vectorstore = FAISS.from_documents(documents=all_splits, embedding=self.llm_embeddings, **_faiss_kwargs())
             else:
                 # Custom approach for Gemini
-                # Convert documents to embeddings manually
+                import faiss
+                import numpy as np
+
+                # Convert documents to embeddings manually, in a single batched request
                 texts = [doc.page_content for doc in all_splits]
-                embeddings = [self.llm_embeddings(text) for text in texts]
+                embeddings = self.llm_embeddings.embed_documents(texts)
                 
-                # Create FAISS index directly
+                # Create an HNSW index directly, ranking normalized vectors by inner product (cosine)
                 dimension = len(embeddings[0])
-                index = FAISS.IndexFlatL2(dimension)
-                index.add(np.array(embeddings).astype('float32'))
+                vectors = np.asarray(embeddings, dtype=np.float32)
+                faiss.normalize_L2(vectors)
+                index = faiss.IndexHNSWFlat(dimension, 32, faiss.METRIC_INNER_PRODUCT)
+                index.hnsw.efConstruction = 40
+                index.add(vectors)
                 
                 # Store the index and texts
                 self.vectorstore = {
                     'index': index,
                     'texts': texts
                 }
+            _vectorstore_cache[self._cache_key] = self.vectorstore
             logger.debug("Vectorstore successfully initialized.")
         except Exception as e:
             logger.error(f"Error during vectorstore creation: {e}")
             raise
 
+        if isinstance(self.vectorstore, FAISS):
+            try:
+                self.vectorstore.save_local(str(faiss_cache_path))
+            except Exception as e:
+                logger.warning(f"Failed to cache vectorstore to {faiss_cache_path}: {e}")
+
     def _retrieve_context(self, query: str, top_k: int = 3) -> str:
         """
         Retrieves the most relevant text fragments using the retriever.
@@ -132,30 +283,92 @@ class LLMParser:
         Returns:
             str: Concatenated text fragments.
         """
+        if self._full_text is not None:
+            return self._full_text
         if not self.vectorstore:
             raise ValueError("Vectorstore not initialized. Run extract_job_description first.")
-        
-        retriever = self.vectorstore.as_retriever()
-        retrieved_docs = retriever.invoke(query)[:top_k]
-        context = " ".join(doc.page_content for doc in retrieved_docs)
-        logger.debug(f"Context retrieved for query '{query}': {context[:200]}...")  # Log the first 200 characters
+
+        if (query, top_k) in self._context_cache:
+            return self._context_cache[(query, top_k)]
+
+        if isinstance(self.vectorstore, dict):
+            # Raw index built for embeddings that are not LangChain Embeddings
+            import faiss
+            import numpy as np
+
+            query_vector = np.asarray([self.llm_embeddings.embed_query(query)], dtype=np.float32)
+            faiss.normalize_L2(query_vector)
+            _, ids = self.vectorstore['index'].search(query_vector, top_k)
+            context = " ".join(self.vectorstore['texts'][i] for i in ids[0] if i != -1)
+        else:
+            retriever = self.vectorstore.as_retriever()
+            retrieved_docs = retriever.invoke(query)[:top_k]
+            context = " ".join(doc.page_content for doc in retrieved_docs)
+        logger.opt(lazy=True).debug("Context retrieved for query '{}': {}...", lambda: query, lambda: context[:200])  # Log the first 200 characters
+        self._context_cache[(query, top_k)] = context
         return context
     
-    def _extract_information(self, question: str, retrieval_query: str) -> str:
+    def _invoke_json_streaming(self, prompt_value) -> str:
+        """
+        Stream the extraction model's reply and stop as soon as the first top-level JSON object is closed,
+        so the model is not left generating trailing commentary.
+        Args:
+            prompt_value: The formatted prompt to send.
+        Returns:
+            str: The reply text up to and including the closing brace.
+        """
+        parts = []
+        depth = 0
+        started = in_string = escaped = False
+        # LoggerChatModel.stream already falls back to the retrying blocking call if streaming fails up front
+        # Closing the stream as soon as the object is complete stops generation and logs the reply
+        with closing(self.llm_extract.stream(prompt_value)) as stream:
+            for content in stream:
+                if not isinstance(content, str):
+                    continue
+                for i, char in enumerate(content):
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif char == '\\':
+                            escaped = True
+                        elif char == '"':
+                            in_string = False
+                    elif char == '"':
+                        in_string = started
+                    elif char == '{':
+                        depth += 1
+                        started = True
+                    elif char == '}' and started:
+                        depth -= 1
+                        if depth == 0:
+                            parts.append(content[:i + 1])
+                            return "".join(parts)
+                parts.append(content)
+        return "".join(parts)
+
+    def _extraction_key(self, question: str, retrieval_query: str) -> str:
+        # Same model, question and context give the same temperature-0 answer
+        return cache_key(self.extract_model_name, question, self._retrieve_context(retrieval_query))
+
+    def _extract_information(self, question: str, retrieval_query: str, expect_json: bool = False) -> str:
         """
         Generic method to extract specific information using the retriever and LLM.
         Args:
             question (str): The question to ask the LLM for extraction.
             retrieval_query (str): The query to use for retrieving relevant context.
+            expect_json (bool): Whether the answer is a single JSON object, which allows stopping the reply early.
         Returns:
             str: The extracted information.
         """
-        # First get the context
-        raw_context = self._retrieve_context(retrieval_query)
-        # Keep content of first major tag (body, main, div) even if unclosed
-        context = re.sub(r'<(?!(?:body|main|div))[^>]*>(?:(?!</[^>]*>).)*$', '', raw_context)
-        # Now safely remove all remaining HTML tags while preserving their content
-        context = re.sub(r'<[^>]*>|</[^>]*>', '', context)
+        # First get the context, which set_body_html already stripped of HTML
+        context = self._retrieve_context(retrieval_query)
+
+        extraction_key = self._extraction_key(question, retrieval_query)
+        cached = self._extraction_cache.get(extraction_key)
+        if cached is not None:
+            logger.debug("Using cached extraction result.")
+            return cached
         
         prompt = ChatPromptTemplate.from_template(
             template="""
@@ -169,14 +382,19 @@ class LLMParser:
             """
         )
         
-        formatted_prompt = prompt.format(context=context, question=question)
-        logger.debug(f"Formatted prompt for extraction: {formatted_prompt[:350]}...")  # Log the first 350 characters
+        prompt_value = prompt.invoke({"context": context, "question": question})
+        logger.opt(lazy=True).debug("Formatted prompt for extraction: {}...", lambda: prompt_value.to_string()[:350])  # Log the first 350 characters
         
         try:
-            chain = prompt | self.llm | StrOutputParser()
-            result = chain.invoke({"context": context, "question": question})
+            if expect_json:
+                result = self._invoke_json_streaming(prompt_value)
+            else:
+                result = self.llm_extract(prompt_value).content
             # Remove code block markers and language tags
-            logger.debug(f"Extracted information: {result}")
+            logger.opt(lazy=True).debug("Extracted information: {}", lambda: result)
+            # A JSON reply may be truncated or malformed, so the caller caches it only once it has parsed
+            if result and not expect_json:
+                self._extraction_cache.set(extraction_key, result)
             return result
         except Exception as e:  
             logger.error(f"Error during information extraction: {e}")
@@ -185,7 +403,7 @@ class LLMParser:
     def clean_llm_response(self, text: str) -> str:
         """Remove markdown code blocks and language tags from LLM response."""
         # Remove code block markers and language tags
-        text = re.sub(r'```(?:json|html)?\n?', '', text)
+        text = _CODE_FENCE_RE.sub('', text)
         text = text.replace('```', '').replace('\n', '')
         # Trim whitespace
         return text.strip()
@@ -200,12 +418,12 @@ class LLMParser:
         Returns:
             str: Clean text with HTML tags removed
         """
-        # Remove all HTML tags using regex
-        clean_text = re.sub(r'<[^>]+>', '', text)
-        return clean_text.strip()
+        return LexborHTMLParser(text).text(separator=' ').strip()
     
     def extract_job_details(self) -> Dict[str, Optional[str]]:
-        """Extracts all job details in a single query."""
+        """Extracts all job details in a single query, cached for the current page."""
+        if self._details_cache is not None:
+            return self._details_cache
         
         unified_prompt = """Analyze the entire job posting. Extract ALL information. Format as JSON. Reply ONLY with the JSON:
         {
@@ -213,7 +431,8 @@ class LLMParser:
             "company": "company name",
             "description": "DETAILED description including: 1) What the role does 2) Day-to-day responsibilities 3) Team structure 4) Project scope 5) Key deliverables. Include ALL bullet points and paragraphs about responsibilities.",
             "requirements": "COMPLETE list as a string of: 1) Required technical skills 2) Years of experience 3) Education requirements 4) Certifications 5) Soft skills 6) Tools/technologies. Include ALL bullet points about requirements in the same string, if some aren't found, skip them. DO NOT mention 'Responsibilities' or 'Requirements' in the string.",
-            "location": "job location, if Remote is mentioned anywhere use Remote, null if not specified"
+            "location": "job location, if Remote is mentioned anywhere use Remote, null if not specified",
+            "email": "recruiter or application contact email address, null if not specified"
         }
         
         IMPORTANT: Include ALL text from requirements and responsibilities sections. Do not summarize or add extra objects, the structure should remain unchanged. If any details are missing, ignore them."""
@@ -221,31 +440,47 @@ class LLMParser:
         retrieval_query = "Job posting details"
         
         try:
-            # raw_response = self._extract_information(unified_prompt, retrieval_query)
-            raw_response = self._extract_information(unified_prompt, retrieval_query)
-            clean_response = self.clean_llm_response(raw_response)
+            raw_response = self._extract_information(unified_prompt, retrieval_query, expect_json=True)
+            # Pull the JSON object out of any surrounding fences or chatter in one scan,
+            # and only fall back to the fence stripping when no object is found
+            json_blob = _JSON_BLOB_RE.search(raw_response)
+            clean_response = json_blob.group(0) if json_blob else self.clean_llm_response(raw_response)
             cleaner_response = self.remove_html_tags(clean_response)
-            cleanest_response = cleaner_response.replace('\n', ' ').replace('\\n', ' ').replace('\r', '')
-            return json.loads(cleanest_response)
-        except json.JSONDecodeError:
+            try:
+                self._details_cache = orjson.loads(cleaner_response)
+            except orjson.JSONDecodeError:
+                # LLM JSON is often nearly valid (trailing commas, raw newlines), salvage it instead of failing
+                logger.warning("LLM response is not valid JSON, attempting to repair it")
+                self._details_cache = json_repair.loads(cleaner_response)
+            if not isinstance(self._details_cache, dict):
+                self._details_cache = None
+                raise ValueError("LLM response is not a JSON object")
+            self._extraction_cache.set(
+                self._extraction_key(unified_prompt, retrieval_query), orjson.dumps(self._details_cache).decode()
+            )
+            return self._details_cache
+        except ValueError:
             logger.error("Failed to parse LLM response as JSON")
         return {
             "role": "",
-            "company_name": "",
-            "job_description": "",
+            "company": "",
+            "description": "",
+            "requirements": "",
             "location": None,
+            "email": None,
         }
     
+    def _job_detail(self, key: str, details: Optional[Dict[str, Optional[str]]] = None) -> str:
+        # Passing the details already extracted avoids asking the LLM again when that extraction failed
+        return (details or self._details_cache or self.extract_job_details()).get(key) or ""
+
     def extract_job_description(self) -> str:
         """
-        Extracts the company name from the job description.
+        Extracts the job description.
         Returns:
             str: The extracted job description.
         """
-        question = "What is the job description of the company? Reply only with the job description, if not found, infer it, but avoid adding extra details; go straight to the point."
-        retrieval_query = "Job description"
-        logger.debug("Starting job description extraction.")
-        return self._extract_information(question, retrieval_query)
+        return self._job_detail("description")
     
     def extract_company_name(self) -> str:
         """
@@ -253,10 +488,7 @@ class LLMParser:
         Returns:
             str: The extracted company name.
         """
-        question = "What is the company's name? Reply only with the company's name, if not found, infer it, but avoid adding extra details; go straight to the point."
-        retrieval_query = "Company name"
-        logger.debug("Starting company name extraction.")
-        return self._extract_information(question, retrieval_query)
+        return self._job_detail("company")
     
     def extract_role(self) -> str:
         """
@@ -264,10 +496,7 @@ class LLMParser:
         Returns:
             str: The extracted role/title.
         """
-        question = "What is the role or title sought in this job description? Reply only with the role/title, if not found, infer it, but avoid adding extra details; go straight to the point."
-        retrieval_query = "Job title"
-        logger.debug("Starting role/title extraction.")
-        return self._extract_information(question, retrieval_query)
+        return self._job_detail("role")
     
     def extract_location(self) -> str:
         """
@@ -275,10 +504,7 @@ class LLMParser:
         Returns:
             str: The extracted location.
         """
-        question = "What is the location mentioned in this job description? Reply only with the location, if not found, infer it, but avoid adding extra details; go straight to the point."
-        retrieval_query = "Location"
-        logger.debug("Starting location extraction.")
-        return self._extract_information(question, retrieval_query)
+        return self._job_detail("location")
     
     def extract_recruiter_email(self) -> str:
         """
@@ -286,17 +512,12 @@ class LLMParser:
         Returns:
             str: The extracted recruiter's email.
         """
-        question = "What is the recruiter's email address in this job description? Reply only with the email, if not found, infer it, but avoid adding extra details; go straight to the point."
-        retrieval_query = "Recruiter email"
-        logger.debug("Starting recruiter email extraction.")
-        email = self._extract_information(question, retrieval_query)
+        email = self._job_detail("email")
         
         # Validate the extracted email using regex
-        email_regex = r'[\w\.-]+@[\w\.-]+\.\w+'
-        if re.match(email_regex, email):
+        if _EMAIL_RE.match(email):
             logger.debug("Valid recruiter's email.")
             return email
         else:
             logger.warning("Invalid or not found recruiter's email.")
             return ""
- 
@@ -0,0 +1,68 @@
+"""
+This module provides a small on-disk cache for LLM results that are expensive to regenerate.
+"""
+# app/libs/resume_and_cover_builder/llm_cache.py
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+from loguru import logger
+
+CACHE_DIRECTORY = Path("log/cover_letter/cache")
+
+
+def cache_key(*parts: str) -> str:
+    """
+    Build a stable cache key from the given text parts.
+    Args:
+        *parts (str): The texts that together identify a cached result.
+    Returns:
+        str: The hex sha256 digest of the parts.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class LLMCache:
+    """
+    A directory of JSON files, one per cached result, named after the cache key.
+    """
+
+    def __init__(self, namespace: str, directory: Path = CACHE_DIRECTORY):
+        self.directory = Path(directory) / namespace
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached value for the key, or None if it is missing or unreadable.
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)["value"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store the value for the key, replacing the file atomically so concurrent readers never see partial writes.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"value": value}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -2,9 +2,12 @@
 This module is used to store the global configuration of the application.
 """
 # app/libs/resume_and_cover_builder/module_loader.py
-import importlib
+import importlib.util
 import sys
+from functools import lru_cache
 
+# The prompt modules never change while the app runs, so each one is executed only once
+@lru_cache(maxsize=8)
 def load_module(module_path: str, module_name: str):
     spec = importlib.util.spec_from_file_location(module_name, module_path)
     module = importlib.util.module_from_spec(spec)
@@ -2,18 +2,36 @@
 This module contains the FacadeManager class, which is responsible for managing the interaction between the user and other components of the application.
 """
 # app/libs/resume_and_cover_builder/manager_facade.py
+import asyncio
+import hashlib
 from datetime import datetime
 import inquirer
+import re
 from pathlib import Path
 
 from loguru import logger
 
 from src.libs.resume_and_cover_builder.llm.llm_job_parser import LLMParser
 from src.job import Job
-from src.libs.resume_and_cover_builder.utils import Utils
+from src.libs.resume_and_cover_builder.utils import LLMLogger, Utils
 from src.utils.chrome_utils import HTML_to_PDF
 from .config import global_config
-from config import LLM_MODEL_TYPE, LLM_MODEL
+from config import LLM_MODEL_TYPE, LLM_MODEL, LLM_MODEL_CHEAP, LLM_EMBEDDINGS_TYPE, LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE
+
+# Characters that are not safe to use in the generated output folder names
+_PATH_SANITIZE_RE = re.compile(r'[^\w\s-]')
+
+
+def _sanitize_path_component(value: str, placeholder: str = "unknown") -> str:
+    # The job details may come back as null, and a folder name cannot be empty
+    return _PATH_SANITIZE_RE.sub('', value or "").strip() or placeholder
+
+
+def _job_link_suffix(link: str) -> str:
+    # Short fingerprint of the job URL that keeps postings with the same company and role apart
+    if not link:
+        return ""
+    return "_" + hashlib.blake2b(link.encode(), digest_size=5).hexdigest()
 
 class ResumeFacade:
     def __init__(self, api_key, style_manager, resume_generator, resume_object, output_path):
@@ -36,15 +54,40 @@ class ResumeFacade:
         global_config.API_KEY = api_key
         global_config.LLM_MODEL_TYPE = LLM_MODEL_TYPE
         global_config.LLM_MODEL = LLM_MODEL
+        global_config.LLM_MODEL_CHEAP = LLM_MODEL_CHEAP
+        global_config.LLM_EMBEDDINGS_TYPE = LLM_EMBEDDINGS_TYPE
+        global_config.LLM_REQUESTS_PER_MINUTE = LLM_REQUESTS_PER_MINUTE
+        global_config.LLM_TOKENS_PER_MINUTE = LLM_TOKENS_PER_MINUTE
         self.style_manager = style_manager
         self.resume_generator = resume_generator
         self.resume_generator.set_resume_object(resume_object)
         self.selected_style = None  # Property to store the selected style
         self.skills = set() # Property to store the user's skills
+        self._job_parsers = {} # Parsers already built for a job URL, reused when the same link is entered again
     
     def set_driver(self, driver):
          self.driver = driver
 
+    def close(self):
+        """
+        Quit the browser and flush the LLM call log. The driver is shared by every PDF generated
+        through the facade, so callers must close the facade once they are done with it.
+        """
+        LLMLogger.flush()
+        driver = getattr(self, 'driver', None)
+        if driver is not None:
+            self.driver = None
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Error while quitting the browser: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def prompt_user(self, choices: list[str], message: str) -> str:
         """
         Prompt the user with the given message and choices.
@@ -73,23 +116,33 @@ class ResumeFacade:
         return inquirer.prompt(questions)['text']
 
     def link_to_job(self, job_url):
-        self.driver.get(job_url)
-        self.driver.implicitly_wait(3)
-        
-        body_element = Utils.get_job_info(self.driver)
-        
-        self.llm_job_parser = LLMParser(global_config)
-        self.llm_job_parser.set_body_html(body_element)
+        if job_url in self._job_parsers:
+            self.llm_job_parser = self._job_parsers[job_url]
+        else:
+            self.driver.get(job_url)
+
+            body_element = Utils.get_job_info(self.driver)
+
+            self.llm_job_parser = LLMParser(global_config)
+            self.llm_job_parser.set_body_html(body_element)
+            self._job_parsers[job_url] = self.llm_job_parser
 
-        self.job = Job()
+        self.job = Job(link=job_url)
         job_details = self.llm_job_parser.extract_job_details()
-        self.job.role = job_details["role"]
-        self.job.company = job_details["company"]
-        self.job.description = job_details["description"]
-        self.job.requirements = job_details["requirements"]
+        self.job.role = self.llm_job_parser._job_detail("role", job_details)
+        self.job.company = self.llm_job_parser._job_detail("company", job_details)
+        self.job.description = self.llm_job_parser._job_detail("description", job_details)
+        self.job.requirements = self.llm_job_parser._job_detail("requirements", job_details)
         self.job.location = job_details["location"]
         logger.info(f"Extracting job details from URL: {job_url}")
 
+    def _tailored_output_name(self) -> str:
+        # Generate a unique name using the job URL hash, shared by every tailored resume output
+        suggested_name = datetime.now().strftime('%Y-%m-%d')
+        suggested_name += _job_link_suffix(self.job.link)
+        suggested_name += "/" + _sanitize_path_component(self.job.company) + "/" + _sanitize_path_component(self.job.role)
+        return suggested_name
+
     def util_create_resume_pdf_job_tailored(self) -> tuple[bytes, str]:
         """
         Create a resume PDF using the selected style and the given job description text.
@@ -105,15 +158,35 @@ class ResumeFacade:
 
         html_resume = self.resume_generator.create_resume_tailored(style_path, self.job)
 
-        # Generate a unique name using the job URL hash
-        suggested_name = datetime.now().strftime('%Y-%m-%d')
-        # suggested_name += hashlib.md5(self.job.link.encode()).hexdigest()[:10]
-        suggested_name += "/" + self.job.company + "/" + self.job.role
-        
         result = HTML_to_PDF(html_resume, self.driver)
-        self.driver.quit()
-        return result, suggested_name
+        return result, self._tailored_output_name()
         
+    async def _generate_tailored_documents_html(self, style_path: str) -> list[str]:
+        # Resume and cover letter generation only share the job summary, so their LLM calls can overlap
+        return await asyncio.gather(
+            asyncio.to_thread(self.resume_generator.create_resume_tailored, style_path, self.job),
+            asyncio.to_thread(
+                self.resume_generator.create_cover_letter_job_description, style_path, self.job.description, self.job
+            ),
+        )
+
+    def util_create_resume_and_cover_letter(self) -> tuple[bytes, bytes, str]:
+        """
+        Create both the tailored resume and the cover letter for the linked job, generating them concurrently.
+        Returns:
+            tuple: A tuple containing the resume PDF, the cover letter PDF and the unique folder name.
+        """
+        style_path = self.style_manager.get_style_path()
+        if style_path is None:
+            raise ValueError("You must choose a style before generating the PDF.")
+
+        resume_html, cover_letter_html = asyncio.run(self._generate_tailored_documents_html(style_path))
+
+        # Rendering goes through the single browser session, so the PDFs are printed one after the other
+        resume_pdf = HTML_to_PDF(resume_html, self.driver)
+        cover_letter_pdf = HTML_to_PDF(cover_letter_html, self.driver)
+        return resume_pdf, cover_letter_pdf, self._tailored_output_name()
+
     def create_resume_pdf(self) -> tuple[bytes, str]:
         """
         Create a resume PDF using the selected style and the given job description text.
@@ -123,14 +196,29 @@ class ResumeFacade:
         Returns:
             tuple: A tuple containing the PDF content as bytes and the unique filename.
         """
+        return self.render_pdf(self.create_resume_html())
+
+    def create_resume_html(self) -> str:
+        """
+        Generate the resume HTML using the selected style. This needs no browser, so it can run while one starts.
+        Returns:
+            str: The complete resume HTML document.
+        """
         style_path = self.style_manager.get_style_path()
         if style_path is None:
             raise ValueError("You must choose a style before generating the PDF.")
-        
-        html_resume = self.resume_generator.create_resume(style_path)
-        result = HTML_to_PDF(html_resume, self.driver)
-        self.driver.quit()
-        return result
+
+        return self.resume_generator.create_resume(style_path)
+
+    def render_pdf(self, html: str):
+        """
+        Print an HTML document to PDF with the facade's browser.
+        Args:
+            html (str): The HTML document to render.
+        Returns:
+            str: The PDF content encoded as base64.
+        """
+        return HTML_to_PDF(html, self.driver)
 
     def util_create_cover_letter(self) -> tuple[bytes, str]:
         """
@@ -146,13 +234,12 @@ class ResumeFacade:
             raise ValueError("You must choose a style before generating the PDF.")
         
         
-        cover_letter_html = self.resume_generator.create_cover_letter_job_description(style_path, self.job.description)
+        cover_letter_html = self.resume_generator.create_cover_letter_job_description(style_path, self.job.description, self.job)
 
         # Generate a unique name using the job URL hash
-        suggested_name = self.job.role + "/" + self.job.company
-        # suggested_name += hashlib.md5(self.job.link.encode()).hexdigest()[:10]
+        suggested_name = _sanitize_path_component(self.job.role) + "/" + _sanitize_path_component(self.job.company)
+        suggested_name += _job_link_suffix(self.job.link)
         suggested_name += "/" + datetime.now().strftime('%Y-%m-%d')
 
         result = HTML_to_PDF(cover_letter_html, self.driver)
-        self.driver.quit()
         return result, suggested_name
\ No newline at end of file
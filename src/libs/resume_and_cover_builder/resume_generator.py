@@ -2,6 +2,9 @@
 This module is responsible for generating resumes and cover letters using the LLM model.
 """
 # app/libs/resume_and_cover_builder/resume_generator.py
+import os
+import threading
+from functools import lru_cache
 from string import Template
 from typing import Any
 from src.job import Job
@@ -11,32 +14,57 @@ from src.libs.resume_and_cover_builder.llm.llm_generate_cover_letter_from_job im
 from .module_loader import load_module
 from .config import global_config
 
+@lru_cache(maxsize=32)
+def _load_css(path: str, mtime: float) -> str:
+    # The modification time is part of the key so an edited style is picked up on the next call
+    with open(path, "r") as f:
+        return f.read()
+
+@lru_cache(maxsize=8)
+def _get_partial_template(html_template: str, path: str, mtime: float) -> Template:
+    # The CSS is substituted once per style so each call only has to fill in the body.
+    # Dollar signs in the CSS are escaped so they are not read as placeholders later on.
+    css = _load_css(path, mtime).replace("$", "$$")
+    return Template(html_template.replace("$style_css", css))
+
+def _get_styled_template(style_path: str) -> Template:
+    try:
+        return _get_partial_template(global_config.html_template, str(style_path), os.path.getmtime(style_path))
+    except FileNotFoundError:
+        raise ValueError(f"The style file was not found in the path: {style_path}")
+    except Exception as e:
+        raise RuntimeError(f"Error while reading CSS file: {e}")
+
 class ResumeGenerator:
     def __init__(self):
-        pass
+        self._summary_lock = threading.Lock()
     
     def set_resume_object(self, resume_object):
          self.resume_object = resume_object
+
+    def _set_job_description(self, gpt_answerer: Any, job_description_text: str, job: Job = None):
+        # The resume and cover letter prompts share the same summarization step, so reuse
+        # the summary already stored on the job instead of asking the LLM for it again.
+        # The lock makes a concurrent generation for the same job wait for that summary.
+        with self._summary_lock:
+            if job is not None and job.summarize_job_description:
+                gpt_answerer.job_description = job.summarize_job_description
+                return
+            gpt_answerer.set_job_description_from_text(job_description_text)
+            if job is not None:
+                job.summarize_job_description = gpt_answerer.job_description
          
     def _create_resume(self, gpt_answerer: Any, style_path: str, job: Job = None):
         gpt_answerer.set_resume(self.resume_object)
         
-        # Read the HTML template
-        template = Template(global_config.html_template)
-        
-        try:
-            with open(style_path, "r") as f:
-                style_css = f.read()  # Correction: call the `read` method with parentheses.
-        except FileNotFoundError:
-            raise ValueError(f"The style file was not found in the path: {style_path}")
-        except Exception as e:
-            raise RuntimeError(f"Error while reading CSS file: {e}")
+        # Read the HTML template with the style already applied
+        template = _get_styled_template(style_path)
         
         # Generate resume HTML
         body_html = gpt_answerer.generate_html_resume(job)
         
         # Apply content to the template
-        return template.substitute(body=body_html, style_css=style_css)
+        return template.substitute(body=body_html)
 
     def create_resume(self, style_path):
         strings = load_module(global_config.STRINGS_MODULE_RESUME_PATH, global_config.STRINGS_MODULE_NAME)
@@ -46,19 +74,17 @@ class ResumeGenerator:
     def create_resume_tailored(self, style_path: str, job: Job):
         strings = load_module(global_config.STRINGS_MODULE_RESUME_JOB_DESCRIPTION_PATH, global_config.STRINGS_MODULE_NAME)
         gpt_answerer = LLMResumeJobDescription(global_config, strings)
-        gpt_answerer.set_job_description_from_text(job.description)
+        self._set_job_description(gpt_answerer, job.description, job)
         return self._create_resume(gpt_answerer, style_path, job)
 
-    def create_cover_letter_job_description(self, style_path: str, job_description_text: str):
+    def create_cover_letter_job_description(self, style_path: str, job_description_text: str, job: Job = None):
         strings = load_module(global_config.STRINGS_MODULE_COVER_LETTER_JOB_DESCRIPTION_PATH, global_config.STRINGS_MODULE_NAME)
         gpt_answerer = LLMCoverLetterJobDescription(global_config, strings)
         gpt_answerer.set_resume(self.resume_object)
-        gpt_answerer.set_job_description_from_text(job_description_text)
+        self._set_job_description(gpt_answerer, job_description_text, job)
         cover_letter_html = gpt_answerer.generate_cover_letter()
-        template = Template(global_config.html_template)
-        with open(style_path, "r") as f:
-            style_css = f.read()
-        return template.substitute(body=cover_letter_html, style_css=style_css)
+        template = _get_styled_template(style_path)
+        return template.substitute(body=cover_letter_html)
     
     
     
\ No newline at end of file
@@ -20,6 +20,8 @@ class StyleManager:
         current_file = Path(__file__).resolve()
         project_root = current_file.parent.parent.parent.parent
         self.styles_directory = project_root / "src" / "libs" / "resume_and_cover_builder" / "resume_style"
+        # (directory mtime, styles) from the last scan, reused until a style is added, removed or renamed
+        self._styles_cache: Optional[Tuple[int, Dict[str, Tuple[str, str]]]] = None
 
         logging.debug(f"Project root determined as: {project_root}")
         logging.debug(f"Styles directory set to: {self.styles_directory}")
@@ -34,14 +36,21 @@ class StyleManager:
         if not self.styles_directory:
             logging.warning("Styles directory is not set.")
             return styles_to_files
+        try:
+            directory_mtime = self.styles_directory.stat().st_mtime_ns
+        except OSError:
+            directory_mtime = None
+        if self._styles_cache is not None and directory_mtime is not None and self._styles_cache[0] == directory_mtime:
+            return dict(self._styles_cache[1])
         logging.debug(f"Reading styles directory: {self.styles_directory}")
         try:
             files = [f for f in self.styles_directory.iterdir() if f.is_file()]
             logging.debug(f"Files found: {[f.name for f in files]}")
             for file_path in files:
                 logging.debug(f"Processing file: {file_path}")
-                with file_path.open("r", encoding="utf-8") as file:
-                    first_line = file.readline().strip()
+                # Only the header comment is needed, so read just the first line instead of the whole stylesheet
+                with file_path.open("rb") as file:
+                    first_line = file.readline(1024).decode("utf-8", "ignore").strip()
                     logging.debug(f"First line of file {file_path.name}: {first_line}")
                     if first_line.startswith("/*") and first_line.endswith("*/"):
                         content = first_line[2:-2].strip()
@@ -57,6 +66,9 @@ class StyleManager:
             logging.error(f"Permission denied for accessing {self.styles_directory}.")
         except Exception as e:
             logging.error(f"Unexpected error while reading styles: {e}")
+        else:
+            if directory_mtime is not None:
+                self._styles_cache = (directory_mtime, dict(styles_to_files))
         return styles_to_files
 
     def format_choices(self, styles_to_files: Dict[str, Tuple[str, str]]) -> List[str]:
@@ -3,31 +3,194 @@ This module contains utility functions for the Resume and Cover Letter Builder s
 """
 
 # app/libs/resume_and_cover_builder/utils.py
-import json
-from bs4 import BeautifulSoup
+import asyncio
+import atexit
+import hashlib
+import re
 import openai
+import orjson
+import random
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
 from langchain_core.messages.ai import AIMessage
 from langchain_core.prompt_values import StringPromptValue
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
 from .config import global_config
 from loguru import logger
 from requests.exceptions import HTTPError as HTTPStatusError
+from selectolax.lexbor import LexborHTMLParser
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 # Extra utils
-from src.utils.constants import JOB_SELECTORS
+from src.utils.constants import JOB_SELECTORS, LINKEDIN_DETAILS_SELECTOR
+
+# Collapses any run of whitespace (newlines included) into a single space
+_WHITESPACE_RE = re.compile(r'\s+')
+# Spelled out units come before the one letter forms, so "500 milliseconds" is not read as 500 minutes
+_DURATION_UNIT_PATTERN = r'(ms|milliseconds?|seconds?|minutes?|hours?|h|m|s)'
+# Durations such as "1s", "250ms" or "6m0s", as sent in the x-ratelimit-reset-* headers, or "1.5 seconds"
+_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)\s*' + _DURATION_UNIT_PATTERN, re.IGNORECASE)
+# Wait hints inside provider error messages, e.g. "Please try again in 6m0s" or "retry in 1.5 seconds"
+_WAIT_TIME_RE = re.compile(
+    r'(?:try again|retry) in ((?:\d+(?:\.\d+)?\s*' + _DURATION_UNIT_PATTERN + r'?\s*)+)', re.IGNORECASE
+)
+_DURATION_UNITS = {
+    "ms": 0.001, "millisecond": 0.001, "milliseconds": 0.001,
+    "s": 1, "second": 1, "seconds": 1,
+    "m": 60, "minute": 60, "minutes": 60,
+    "h": 3600, "hour": 3600, "hours": 3600,
+}
+# Upper bound on a wait read from a header or error message, so a misread hint cannot stall every call for hours
+_MAX_REQUESTED_WAIT = 600.0
+# The "sha1" line of a prompt catalog entry; JSON strings escape newlines, so prompt text cannot match it
+_CATALOG_SHA1_RE = re.compile(rb'^  "sha1": "([0-9a-f]{40})"', re.MULTILINE)
+
+# Runs the JOB_SELECTORS waterfall in the browser and returns the first match. On LinkedIn job pages the
+# details selector matches three elements, and the text of the first and last one is merged instead.
+_FIND_JOB_CONTENT_JS = """
+const [selectors, linkedinDetails] = arguments;
+for (const selector of selectors) {
+    try {
+        let elements;
+        if (selector.type === 'css selector') {
+            elements = document.querySelectorAll(selector.value);
+        } else if (selector.type === 'class name') {
+            elements = document.getElementsByClassName(selector.value);
+        } else if (selector.type === 'id') {
+            const element = document.getElementById(selector.value);
+            elements = element ? [element] : [];
+        } else if (selector.type === 'tag name') {
+            elements = document.getElementsByTagName(selector.value);
+        } else {
+            // Not a Selenium locator type (e.g. 'class'), find_element rejected these so they are skipped too
+            continue;
+        }
+        if (!elements.length) {
+            continue;
+        }
+        if (selector.type === 'css selector' && selector.value === linkedinDetails) {
+            if (elements.length === 3) {
+                return {selector: selector.value, text: elements[0].innerText.slice(0, 100) + ' ' + elements[2].innerText};
+            }
+            continue;
+        }
+        const element = elements[0];
+        const content = selector.attr in element ? element[selector.attr] : element.getAttribute(selector.attr);
+        if (content) {
+            return {selector: selector.value, html: content};
+        }
+    } catch (error) {
+        // An invalid selector only skips that selector, like a failed find_element did
+        continue;
+    }
+}
+return null;
+"""
+# WebDriver sends tuples to the page as arrays, so the selectors are converted to plain objects once
+_JOB_SELECTORS_JS = [selector._asdict() for selector in JOB_SELECTORS]
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit.lower()] for amount, unit in parts)
+
+
+def _retry_after_seconds(err: Exception) -> Optional[float]:
+    # Reads how long the API asked us to wait from the rate limit response headers, if it said so
+    headers = getattr(getattr(err, "response", None), "headers", None)
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                # Retry-After may also be an HTTP date
+                return (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+    reset = headers.get("x-ratelimit-reset-requests") or headers.get("x-ratelimit-reset-tokens")
+    return _parse_duration(reset) if reset else None
 
 
 class LLMLogger:
+    # The log files stay open for the whole run so each request is a buffered write, not an open/write/close
+    _files = {}
+    _lock = threading.Lock()
+    # Hashes of the prompt texts already in the prompt catalog, seeded from the file when it is first opened
+    _logged_prompts = set()
 
     def __init__(self, llm: ChatOpenAI):
         self.llm = llm
 
+    @classmethod
+    def _get_file(cls, path):
+        log_file = cls._files.get(path)
+        if log_file is None:
+            log_file = open(path, "ab", buffering=64 * 1024)
+            cls._files[path] = log_file
+        return log_file
+
+    @classmethod
+    def _get_catalog_file(cls, path):
+        # The catalog persists across runs, so the hashes it already holds are read back before
+        # appending to it. Entries are indented JSON, so each one has its "sha1" key on its own line.
+        if path not in cls._files:
+            try:
+                with open(path, "rb") as catalog:
+                    cls._logged_prompts.update(
+                        match.group(1).decode() for match in _CATALOG_SHA1_RE.finditer(catalog.read())
+                    )
+            except FileNotFoundError:
+                pass
+        return cls._get_file(path)
+
+    @classmethod
+    def flush(cls):
+        """
+        Write any buffered log entries to disk.
+        """
+        with cls._lock:
+            for log_file in cls._files.values():
+                log_file.flush()
+
+    @classmethod
+    def close(cls):
+        """
+        Flush and close the log files, they are reopened on the next request.
+        """
+        with cls._lock:
+            for log_file in cls._files.values():
+                log_file.close()
+            cls._files.clear()
+
     @staticmethod
-    def log_request(prompts, parsed_reply: Dict[str, Dict]):
+    def _prompt_digest(prompt) -> Optional[str]:
+        if not isinstance(prompt, str):
+            return None
+        return hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def log_request(cls, prompts, parsed_reply: Dict[str, Dict]):
         calls_log = global_config.LOG_OUTPUT_FILE_PATH / "ai_calls.json"
+        prompts_catalog = global_config.LOG_OUTPUT_FILE_PATH / "prompts_catalog.json"
         if isinstance(prompts, StringPromptValue):
             prompts = prompts.text
         elif isinstance(prompts, Dict):
@@ -42,6 +205,17 @@ class LLMLogger:
                 for i, prompt in enumerate(prompts.messages)
             }
 
+        # Most prompt text repeats across calls (shared instructions, the same resume), so each distinct
+        # text is written once to prompts_catalog.json and the call log only references it by hash
+        texts = prompts if isinstance(prompts, dict) else {"prompt_1": prompts}
+        digests = {name: cls._prompt_digest(text) for name, text in texts.items()}
+        prompt_refs = {
+            name: f"sha1:{digest}" if digest is not None else texts[name]
+            for name, digest in digests.items()
+        }
+        if not isinstance(prompts, dict):
+            prompt_refs = prompt_refs["prompt_1"]
+
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # Extract token usage details from the response
@@ -64,7 +238,7 @@ class LLMLogger:
         log_entry = {
             "model": model_name,
             "time": current_time,
-            "prompts": prompts,
+            "prompts": prompt_refs,
             "replies": parsed_reply["content"],  # Response content
             "total_tokens": total_tokens,
             "input_tokens": input_tokens,
@@ -73,48 +247,244 @@ class LLMLogger:
         }
 
         # Write the log entry to the log file in JSON format
-        with open(calls_log, "a", encoding="utf-8") as f:
-            json_string = json.dumps(log_entry, ensure_ascii=False, indent=4)
-            f.write(json_string + "\n")
+        json_bytes = orjson.dumps(log_entry, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with cls._lock:
+            # Opening the catalog first loads the hashes written by earlier runs
+            catalog_file = cls._get_catalog_file(prompts_catalog)
+            for name, digest in digests.items():
+                if digest is not None and digest not in cls._logged_prompts:
+                    cls._logged_prompts.add(digest)
+                    catalog_entry = orjson.dumps({"sha1": digest, "prompt": texts[name]}, option=orjson.OPT_INDENT_2)
+                    catalog_file.write(catalog_entry + b"\n")
+            cls._get_file(calls_log).write(json_bytes + b"\n")
+
+
+atexit.register(LLMLogger.close)
+
+class RateLimiter:
+    """
+    Client-side limit on requests and tokens per minute, checked before each LLM call so that
+    parallel calls wait their turn instead of running into 429 responses and backing off.
+    """
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None, window: float = 60.0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window = window
+        self._requests = deque()
+        self._tokens = deque()
+        self._token_total = 0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        # Records the request and returns 0 if it fits in the window, otherwise returns how long to wait
+        now = time.monotonic()
+        while self._requests and now - self._requests[0] >= self.window:
+            self._requests.popleft()
+        while self._tokens and now - self._tokens[0][0] >= self.window:
+            self._token_total -= self._tokens.popleft()[1]
+
+        wait = self._paused_until - now
+        if self.rpm and len(self._requests) >= self.rpm:
+            wait = max(wait, self._requests[0] + self.window - now)
+        # A single request larger than the whole budget is let through once the window is empty
+        if self.tpm and self._tokens and self._token_total + tokens > self.tpm:
+            wait = max(wait, self._tokens[0][0] + self.window - now)
+        if wait > 0:
+            return wait
+
+        self._requests.append(now)
+        self._tokens.append((now, tokens))
+        self._token_total += tokens
+        return 0
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until a request of the given size fits within the limits.
+        Args:
+            tokens (int): The estimated number of tokens the request will use.
+        """
+        while True:
+            with self._lock:
+                wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """
+        Asynchronous version of acquire.
+        """
+        while True:
+            with self._lock:
+                wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Hold back every request for the given time, used after the API reports a rate limit anyway.
+        Args:
+            seconds (float): How long to pause new requests.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> RateLimiter:
+    # One limiter per process, since every model instance draws on the same API quota
+    return RateLimiter(global_config.LLM_REQUESTS_PER_MINUTE, global_config.LLM_TOKENS_PER_MINUTE)
+
 
 class LoggerChatModel:
 
     def __init__(self, llm: ChatOpenAI):
         self.llm = llm
+        self._limiter = get_rate_limiter()
+
+    @staticmethod
+    def _estimate_tokens(messages) -> int:
+        # Roughly four characters per token, close enough for budgeting requests
+        prompt = messages.to_string() if hasattr(messages, "to_string") else str(messages)
+        return len(prompt) // 4
+
+    def _handle_reply(self, messages, reply):
+        parsed_reply = self.parse_llmresult(reply)
+        LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply)
+        return reply
+
+    @staticmethod
+    def parse_wait_time_from_error_message(error_message: str) -> Optional[float]:
+        """
+        Extract the suggested wait time from a rate limit error message.
+        Args:
+            error_message (str): The error message returned by the provider.
+        Returns:
+            Optional[float]: The wait time in seconds, or None if the message does not contain one.
+        """
+        match = _WAIT_TIME_RE.search(error_message)
+        if not match:
+            return None
+        duration = match.group(1).strip()
+        wait_time = _parse_duration(duration)
+        return wait_time if wait_time is not None else float(duration)
+
+    def _retry_wait(self, err: Exception, attempt: int, max_retries: int, retry_delay: float) -> tuple[float, float]:
+        # Returns how long to wait before the next attempt and the backoff delay to use after that
+        if isinstance(err, (openai.RateLimitError, HTTPStatusError)):
+            response = getattr(err, "response", None)
+            is_rate_limit = isinstance(err, openai.RateLimitError) or getattr(response, "status_code", None) == 429
+            # Prefer the wait the API asked for, it avoids both oversleeping and retrying too early
+            wait_time = _retry_after_seconds(err)
+            if wait_time is None:
+                wait_time = self.parse_wait_time_from_error_message(str(err))
+            if wait_time is not None:
+                wait_time = min(max(wait_time, 1.0), _MAX_REQUESTED_WAIT)
+                next_delay = retry_delay
+                logger.warning(f"Rate limit exceeded or API error. Waiting for {wait_time:.1f} seconds as requested by the API before retrying (Attempt {attempt + 1}/{max_retries})...")
+            else:
+                # Jitter keeps parallel calls that failed together from retrying in lockstep
+                wait_time = retry_delay + random.uniform(0, 1)
+                next_delay = retry_delay * 2
+                logger.warning(f"Rate limit exceeded or API error. Waiting for {wait_time:.1f} seconds before retrying (Attempt {attempt + 1}/{max_retries})...")
+            if is_rate_limit:
+                self._limiter.penalize(wait_time)
+            return wait_time, next_delay
+        logger.error(f"Unexpected error occurred: {str(err)}, retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{max_retries})")
+        return retry_delay, retry_delay * 2
 
     def __call__(self, messages: List[Dict[str, str]]) -> str:
         max_retries = 15
         retry_delay = 10
 
+        tokens = self._estimate_tokens(messages)
         for attempt in range(max_retries):
             try:
+                self._limiter.acquire(tokens)
                 reply = self.llm.invoke(messages)
-                parsed_reply = self.parse_llmresult(reply)
-                LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply)
-                return reply
-            except (openai.RateLimitError, HTTPStatusError) as err:
-                if isinstance(err, HTTPStatusError) and err.response.status_code == 429:
-                    logger.warning(f"HTTP 429 Too Many Requests: Waiting for {retry_delay} seconds before retrying (Attempt {attempt + 1}/{max_retries})...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    wait_time = self.parse_wait_time_from_error_message(str(err))
-                    logger.warning(f"Rate limit exceeded or API error. Waiting for {wait_time} seconds before retrying (Attempt {attempt + 1}/{max_retries})...")
-                    time.sleep(wait_time)
-            except Exception as e:
-                logger.error(f"Unexpected error occurred: {str(e)}, retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{max_retries})")
-                time.sleep(retry_delay)
-                retry_delay *= 2
+                return self._handle_reply(messages, reply)
+            except Exception as err:
+                wait_time, retry_delay = self._retry_wait(err, attempt, max_retries, retry_delay)
+                time.sleep(wait_time)
 
         logger.critical("Failed to get a response from the model after multiple attempts.")
         raise Exception("Failed to get a response from the model after multiple attempts.")
 
+    def as_runnable(self) -> RunnableLambda:
+        """
+        Wrap the model for LCEL chains, so a chain run with ainvoke awaits acall instead of blocking a thread.
+        Returns:
+            RunnableLambda: A runnable calling this model.
+        """
+        return RunnableLambda(self.__call__, afunc=self.acall)
+
+    async def acall(self, messages: List[Dict[str, str]]) -> AIMessage:
+        """
+        Asynchronous version of the call, so independent prompts can be awaited together with asyncio.gather.
+        Chains built with as_runnable use it when they are run with ainvoke.
+        Uses the same logging and retry policy, but waits with asyncio.sleep so other calls keep running.
+        Args:
+            messages: The prompt to send to the model.
+        Returns:
+            AIMessage: The model reply.
+        """
+        max_retries = 15
+        retry_delay = 10
+
+        tokens = self._estimate_tokens(messages)
+        for attempt in range(max_retries):
+            try:
+                await self._limiter.aacquire(tokens)
+                reply = await self.llm.ainvoke(messages)
+                return self._handle_reply(messages, reply)
+            except Exception as err:
+                wait_time, retry_delay = self._retry_wait(err, attempt, max_retries, retry_delay)
+                await asyncio.sleep(wait_time)
+
+        logger.critical("Failed to get a response from the model after multiple attempts.")
+        raise Exception("Failed to get a response from the model after multiple attempts.")
+
+    def stream(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """
+        Stream the reply content as it is generated, logging the reply once it is complete or the
+        caller stops reading. A failure before the first chunk falls back to the retrying blocking call;
+        once output has been yielded the request cannot be replayed, so later errors are raised to the caller.
+        Args:
+            messages: The prompt to send to the model.
+        Yields:
+            str: The reply content, chunk by chunk.
+        """
+        reply = None
+        try:
+            self._limiter.acquire(self._estimate_tokens(messages))
+            for chunk in self.llm.stream(messages):
+                reply = chunk if reply is None else reply + chunk
+                yield chunk.content
+        except GeneratorExit:
+            # The caller closed the stream early, log the part of the reply that was generated
+            if reply is not None:
+                LLMLogger.log_request(prompts=messages, parsed_reply=self.parse_llmresult(reply))
+            raise
+        except Exception as e:
+            if reply is not None:
+                raise
+            logger.warning(f"Streaming failed before any output ({e}), falling back to a blocking call")
+            reply = self(messages)
+            yield reply.content
+            return
+        if reply is not None:
+            LLMLogger.log_request(prompts=messages, parsed_reply=self.parse_llmresult(reply))
+
     def parse_llmresult(self, llmresult: AIMessage) -> Dict[str, Dict]:
         # Parse the LLM result into a structured format.
         content = llmresult.content
         response_metadata = llmresult.response_metadata
         id_ = llmresult.id
-        usage_metadata = llmresult.usage_metadata
+        # Streamed replies from some providers carry no usage metadata
+        usage_metadata = llmresult.usage_metadata or {}
 
         parsed_result = {
             "content": content,
@@ -145,18 +515,19 @@ class Utils:
             Removes modal/overlay elements from the webpage using JavaScript.
         get_job_info(driver): 
             Extracts and processes job description information from a webpage.
-        This class expects the necessary dependencies (Selenium WebDriver, BeautifulSoup) 
+        This class expects the necessary dependencies (Selenium WebDriver, selectolax) 
         to be properly initialized and the JOB_SELECTORS global variable to be defined 
         with appropriate selector information for different job posting platforms.
     Dependencies:
         - selenium.webdriver
-        - bs4.BeautifulSoup
+        - selectolax.lexbor.LexborHTMLParser
         - logging (for logger)
     """
     @staticmethod
     def click_dismiss_button(driver):
         """
-        Attempts to remove any modal or overlay elements from the webpage by hiding them via JavaScript.
+        Attempts to remove any modal or overlay elements from the webpage by hiding them via JavaScript,
+        and expands the job description by clicking its "Show more" button if there is one.
         Args:
             driver: Selenium WebDriver instance used to execute JavaScript on the page
         Returns:
@@ -164,6 +535,7 @@ class Utils:
         Note:
             This function uses JavaScript to directly hide elements with 'overlay' or 'modal' in their class names,
             rather than trying to click dismiss buttons. Previous implementation using click attempts is commented out.
+            Both steps run in a single script, so this costs one WebDriver round trip.
         """
         # Maybe use these in the future? idk ¯\_ (ツ)_/¯
         # selectors = [
@@ -172,11 +544,15 @@ class Utils:
         #    "button[class*='close']"
         # ]
         
-        # Remove any overlays
+        # Remove any overlays, then click the "Show more" button if it exists
         driver.execute_script("""
             document.querySelectorAll('[class*="overlay"],[class*="modal"]').forEach(el => {
                 el.style.display = 'none';
             });
+            const showMore = document.querySelector("button[class*='show-more']");
+            if (showMore) {
+                showMore.click();
+            }
         """)
         return True
     
@@ -188,7 +564,7 @@ class Utils:
         LinkedIn-specific page structures. It includes functionality to:
         - Click 'Show more' buttons if present
         - Handle LinkedIn's specific job detail layout
-        - Clean up HTML content using BeautifulSoup
+        - Clean up HTML content using selectolax
         - Remove unnecessary elements from job descriptions
         Args:
             driver (selenium.webdriver): An initialized Selenium WebDriver instance
@@ -200,55 +576,40 @@ class Utils:
             The method expects global JOB_SELECTORS to be defined with appropriate selector information
             for different job posting platforms.
         """
-        dismiss_button_clicked = False
-        for selector in JOB_SELECTORS:
-            try:
-                # Click the "Show more" button if it exists and not already clicked
-                if not dismiss_button_clicked:
-                    try:
-                        dismiss_button_clicked = Utils.click_dismiss_button(driver)
-                        driver.find_element("css selector", "button[class*='show-more']").click()
-                    except:
-                        # Button not found - likely end of content or different page structure
-                        pass
-                element = driver.find_element(selector["type"], selector["value"])
+        # Wait explicitly for the page body instead of an implicit wait, which would also delay every selector miss below
+        WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        # Hide overlays and click the "Show more" button, once per page
+        try:
+            Utils.click_dismiss_button(driver)
+        except Exception as e:
+            logger.debug(f"Could not dismiss overlays: {str(e)}")
+
+        body_element = None
+        try:
+            # Try every selector inside the browser, one WebDriver round trip instead of one per selector
+            result = driver.execute_script(_FIND_JOB_CONTENT_JS, _JOB_SELECTORS_JS, LINKEDIN_DETAILS_SELECTOR)
+        except Exception as e:
+            logger.debug(f"Job content lookup failed: {str(e)}")
+            result = None
+        if result:
+            logger.debug(f"Job content found with selector {result['selector']}")
+            if result.get("text") is not None:
+                # LinkedIn job page, the text of the first and last details elements was already merged
+                body_element = _WHITESPACE_RE.sub(' ', result["text"]).strip()
+            else:
+                # Parse HTML with selectolax, the tree stays in C memory until a node is accessed
+                tree = LexborHTMLParser(result["html"])
+                
+                # Check each element with class="artdeco-card" that doesn't have tabindex="-1"; the selector
+                # leaves those out so their text is never extracted
+                for card in tree.css('.artdeco-card:not([tabindex="-1"])'):
+                    # If card doesn't contain 'About the ' text
+                    if 'About the ' not in card.text():
+                        card.decompose()
                 
-                # If this is true, then we're checking a LinkedIn job page, and we need to discard extra elements
-                if selector['type'] == 'css selector' and selector["value"] == "div[class*='details']":
-                    elements = driver.find_elements(selector["type"], selector["value"])
-                    # Make sure that there are three elements to avoid issues
-                    if len(elements) == 3:
-                        # Combine text from the last two elements
-                        element = elements[0]  # Keep first element
-                        merged_text = elements[0].text[:100] + " " + elements[2].text # Add text from the first and last elements
-                        body_element = merged_text.replace('\n', ' ').strip()
-                        # Ignore the next step and break out of the loop
-                        break
-                else:
-                    body_element = element.get_attribute(selector["attr"])
-                if body_element:
-                    # Parse HTML with BeautifulSoup
-                    soup = BeautifulSoup(body_element, 'html.parser')
-                    
-                    # Find all elements with class="artdeco-card"
-                    artdeco_cards = soup.find_all(class_="artdeco-card")
-                    
-                    # Check each artdeco-card element
-                    for card in artdeco_cards:
-                        # If card doesn't contain 'About the ' text and doesn't have tabindex="-1"
-                        if 'About the ' not in card.text and card.get('tabindex') != '-1':
-                            card.decompose()
-                    
-                    # Convert back to string
-                    body_element = str(soup)
-                    
-                    # Remove the contents of all html tags, leaving only the text
-                    body_element = BeautifulSoup(body_element, 'html.parser').get_text()
-                    body_element.replace('\n', ' ').strip()
-                    break
-            except Exception as e:
-                logger.debug(f"Selector {selector['value']} failed: {str(e)}")
-                continue
+                # Keep only the text of the remaining tree, in the same parse
+                root = tree.body or tree.root
+                body_element = root.text(separator=' ', strip=True) if root is not None else ''
         if body_element is None or "cannot be reached" in body_element.lower():
             logger.error("Job page cannot be reached or is inaccessible")
             driver.quit()
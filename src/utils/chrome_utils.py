@@ -1,6 +1,6 @@
 import os
-import time
 from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager  # Import webdriver_manager
@@ -27,6 +27,7 @@ def chrome_browser_options():
     options.add_argument("--disable-autofill")
     options.add_argument("--disable-plugins")
     options.add_argument("--disable-animations")
+    options.add_argument("--mute-audio")
     options.add_argument("--disable-cache")
     options.add_argument("--incognito")
     options.add_argument("--allow-file-access-from-files")  # Consente l'accesso ai file locali
@@ -47,6 +48,22 @@ def init_browser(options=None) -> webdriver.Chrome:
         logger.error(f"Failed to initialize browser: {str(e)}")
         raise RuntimeError(f"Failed to initialize browser: {str(e)}")
 
+def warm_up_pdf_renderer(driver):
+    """
+    Load a blank page and print it once, so the renderer and the PDF backend are initialized
+    before the first real document is printed.
+    """
+    try:
+        driver.get("about:blank")
+        driver.execute_cdp_cmd("Page.printToPDF", {})
+        logger.debug("PDF renderer warmed up.")
+    except Exception as e:
+        logger.debug(f"PDF renderer warm-up failed: {str(e)}")
+
+def init_pdf_browser(options=None) -> webdriver.Chrome:
+    driver = init_browser(options)
+    warm_up_pdf_renderer(driver)
+    return driver
 
 
 def HTML_to_PDF(html_content, driver):
@@ -69,8 +86,10 @@ def HTML_to_PDF(html_content, driver):
 
     try:
         driver.get(data_url)
-        # Attendi che la pagina si carichi completamente
-        time.sleep(2)  # Potrebbe essere necessario aumentare questo tempo per HTML complessi
+        # Attendi che la pagina si carichi completamente, senza un'attesa fissa
+        WebDriverWait(driver, 10).until(lambda d: d.execute_script("return document.readyState") == "complete")
+        # I web font possono finire di caricarsi dopo l'evento load
+        driver.execute_async_script("document.fonts.ready.then(() => arguments[arguments.length - 1]());")
 
         # Esegue il comando CDP per stampare la pagina in PDF
         pdf_base64 = driver.execute_cdp_cmd("Page.printToPDF", {
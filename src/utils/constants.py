@@ -1,3 +1,5 @@
+from collections import namedtuple
+
 DATE_ALL_TIME = "all_time"
 DATE_MONTH = "month"
 DATE_WEEK = "week"
@@ -76,14 +78,19 @@ GEMINI = "gemini"
 HUGGINGFACE = "huggingface"
 PERPLEXITY = "perplexity"
 
-JOB_SELECTORS = [
-    {"type": "css selector", "value": "script[data-testid='job-ldjson']", "attr": "innerHTML"},
-    {"type": "css selector", "value": "div[data-testid='content']", "attr": "innerHTML"},
-    {"type": "css selector", "value": "div[class='details']", "attr": "innerHTML"},
-    {"type": "css selector", "value": "div[class*='details']", "attr": "innerHTML"},
-    #{"type": "css selector", "value": "div[class*='details']:not([class*='mx-details-container-padding'])", "attr": "innerHTML"},
-    {"type": "css selector", "value": "div[role='main']", "attr": "innerHTML"},
-    {"type": "class", "value": "flex-shrink", "attr": "innerHTML"},
-    {"type": "id", "value": "content", "attr": "innerHTML"},
-    {"type": "tag name", "value": "body", "attr": "innerHTML"}  # fallback
-]
\ No newline at end of file
+JobSelector = namedtuple("JobSelector", "type value attr")
+
+# Matches the three detail panes of a LinkedIn job page, handled separately when extracting the job text
+LINKEDIN_DETAILS_SELECTOR = "div[class*='details']"
+
+JOB_SELECTORS = (
+    JobSelector("css selector", "script[data-testid='job-ldjson']", "innerHTML"),
+    JobSelector("css selector", "div[data-testid='content']", "innerHTML"),
+    JobSelector("css selector", "div[class='details']", "innerHTML"),
+    JobSelector("css selector", LINKEDIN_DETAILS_SELECTOR, "innerHTML"),
+    #JobSelector("css selector", "div[class*='details']:not([class*='mx-details-container-padding'])", "innerHTML"),
+    JobSelector("css selector", "div[role='main']", "innerHTML"),
+    JobSelector("class", "flex-shrink", "innerHTML"),
+    JobSelector("id", "content", "innerHTML"),
+    JobSelector("tag name", "body", "innerHTML")  # fallback
+)
\ No newline at end of file